@@ -0,0 +1,55 @@
+"""
+Measures how long it takes to work out which namespaces an event should be
+sent to, as the number of registered namespaces grows. Each extra namespace is
+a handler for one particular key, like ``input.keyboard.down.a``.
+
+The "scan" column forgets the remembered answers before every lookup, which
+is the cost of checking every registered namespace each time an event fires.
+
+Run it from the root of the repository:
+
+    python -m benchmarks.event_dispatch
+"""
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+from designer import *
+
+NAMESPACE_COUNTS = [10, 100, 1000]
+LOOKUPS = 2000
+EVENT_TYPES = ['director.update', 'director.render', 'input.mouse.motion',
+               'input.keyboard.down.space']
+
+
+def on_key():
+    pass
+
+
+def measure(namespace_count, scan):
+    scene = get_director().current_scene
+    namespaces = [f'input.keyboard.down.key{index}' for index in range(namespace_count)]
+    for namespace in namespaces:
+        scene.register(namespace, on_key)
+    started = time.perf_counter()
+    for _ in range(LOOKUPS):
+        for event_type in EVENT_TYPES:
+            if scan:
+                scene._namespace_cache.clear()
+            scene._get_namespaces(event_type)
+    elapsed = time.perf_counter() - started
+    for namespace in namespaces:
+        scene._unregister(namespace, on_key)
+        scene._namespaces.discard(namespace)
+    scene._namespace_cache.clear()
+    return elapsed / (LOOKUPS * len(EVENT_TYPES))
+
+
+if __name__ == '__main__':
+    print(f"{'namespaces':>11} {'scan (us)':>10} {'cached (us)':>12}")
+    for count in NAMESPACE_COUNTS:
+        before = measure(count, True) * 1e6
+        after = measure(count, False) * 1e6
+        print(f"{count:>11} {before:>10.3f} {after:>12.3f}")
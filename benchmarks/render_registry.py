@@ -0,0 +1,95 @@
+"""
+Compares the ways of asking every object for its blit each frame: sending
+the ``director.render`` event to a handler registered for each object (how
+objects used to be drawn), and walking the scene's render registry directly.
+
+Sending the event is timed twice. The "uncached" column works out which
+namespaces the event goes to again every frame, as the original event
+dispatch did (the render handlers are registered with explicit, empty
+arguments, so neither version inspects them), which makes it the closest
+stand-in for the original code. The "events" column uses today's dispatch,
+where the namespaces are remembered, so comparing it with the "registry"
+column shows what the registry saves on its own.
+
+Still objects are static after a few frames, so their render phase is almost
+entirely the cost of reaching each object. Moving objects also pay for
+building a fresh blit every frame, which is the same either way.
+
+Run it from the root of the repository:
+
+    python -m benchmarks.render_registry
+"""
+import os
+import random
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+from designer import *
+from designer.core.event import Event
+
+OBJECT_COUNTS = [500, 1000, 2000]
+FRAMES = 60
+
+
+def render_with_events(scene):
+    scene._handle_event("director.render", Event(world=None))
+
+
+def render_with_uncached_events(scene):
+    scene._namespace_cache.clear()
+    scene._handle_event("director.render", Event(world=None))
+
+
+def render_with_registry(scene):
+    scene._handle_event("director.render", Event(world=None))
+    scene._render_objects()
+
+
+def measure(object_count, use_events, moving, cached=True):
+    random.seed(0)
+    scene = get_director().current_scene
+    objects = [circle('red', 4, random.randint(0, 800), random.randint(0, 600))
+               for _ in range(object_count)]
+    for obj in objects:
+        obj._reactivate()
+    if use_events:
+        # Reproduce the old setup, where only the event reached the objects
+        renderables, scene._renderables = scene._renderables, {}
+        for obj in objects:
+            scene.register('director.render', obj._draw)
+        render = render_with_events if cached else render_with_uncached_events
+    else:
+        render = render_with_registry
+    # Give the still objects enough frames to become static
+    for _ in range(10):
+        render(scene)
+        scene._draw()
+    elapsed = 0
+    for _ in range(FRAMES):
+        if moving:
+            for obj in objects:
+                obj.x = (obj.x + 1) % 800
+        started = time.perf_counter()
+        render(scene)
+        elapsed += time.perf_counter() - started
+        scene._draw()
+    if use_events:
+        for obj in objects:
+            scene._unregister('director.render', obj._draw)
+        scene._renderables = renderables
+    for obj in objects:
+        obj.destroy()
+    scene._draw()
+    return elapsed / FRAMES
+
+
+if __name__ == '__main__':
+    print(f"{'objects':>8} {'moving':>7} {'uncached (ms)':>14} {'events (ms)':>12} {'registry (ms)':>14}")
+    for moving in (False, True):
+        for count in OBJECT_COUNTS:
+            uncached = measure(count, True, moving, cached=False) * 1000
+            events = measure(count, True, moving) * 1000
+            registry = measure(count, False, moving) * 1000
+            print(f"{count:>8} {str(moving):>7} {uncached:>14.3f} {events:>12.3f} {registry:>14.3f}")
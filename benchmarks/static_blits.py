@@ -0,0 +1,57 @@
+"""
+Measures how long the scene takes to draw a frame as the number of static
+objects grows, while a fixed number of objects move around on top of them.
+
+Run it from the root of the repository:
+
+    python -m benchmarks.static_blits
+"""
+import os
+import random
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+from designer import *
+from designer.core.event import Event
+
+STATIC_COUNTS = [100, 200, 400, 800, 1600]
+MOVING_COUNT = 40
+FRAMES = 120
+
+
+def render_frame(scene):
+    scene._handle_event("director.render", Event(world=None))
+    scene._render_objects()
+    scene._draw()
+
+
+def measure(static_count):
+    random.seed(0)
+    scene = get_director().current_scene
+    statics = [rectangle('green', 12, 12, random.randint(0, 800), random.randint(0, 600))
+               for _ in range(static_count)]
+    movers = [circle('red', 8, random.randint(0, 800), random.randint(0, 600))
+              for _ in range(MOVING_COUNT)]
+    for obj in statics + movers:
+        obj._reactivate()
+    # Give the still objects enough frames to become static
+    for _ in range(10):
+        render_frame(scene)
+    started = time.perf_counter()
+    for _ in range(FRAMES):
+        for mover in movers:
+            mover.x = (mover.x + 5) % 800
+        render_frame(scene)
+    elapsed = time.perf_counter() - started
+    for obj in statics + movers:
+        obj.destroy()
+    render_frame(scene)
+    return elapsed / FRAMES
+
+
+if __name__ == '__main__':
+    print(f"{'static objects':>15} {'ms / frame':>12}")
+    for count in STATIC_COUNTS:
+        print(f"{count:>15} {measure(count) * 1000:>12.3f}")
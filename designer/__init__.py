@@ -53,7 +53,10 @@ __all__ = [
     'start', 'debug',
     'stop', 'restart',
     'pause', 'resume',
-    'colliding', 'colliding_with_mouse', 'would_collide',
+    'after', 'every',
+    'colliding', 'colliding_with_mouse', 'would_collide', 'sweep_collision',
+    'get_colliding_objects', 'get_objects_in_area', 'get_objects_at',
+    'colliding_pairs', 'colliding_any',
     'destroy',
     'DesignerObject',
     # Positioning
@@ -93,9 +93,39 @@ Scheduling miscellanous callbacks:
         "..."
     clock.schedule_interval(every_second_of_every_day, 1.0)
 
+    reminder = clock.schedule(remind, 5.0, life=1)
+    reminder.cancel()
+
+Schedules are kept in a heap ordered by when they are next due, so adding,
+running, or cancelling one costs O(log n) no matter how many are pending.
+Cancelled items are only dropped from the heap when they reach the top (or
+when they make up most of it).
+
 The update_callback receives a single DT argument, which is the time-step
 in seconds since the last update.
 
+Catching up:
+
+    clock.max_catchup = 5
+
+By default the clock runs at most one update per tick, so if the game falls
+behind, game time runs slower than real time. With a MAX_CATCHUP above one,
+the clock instead keeps a fixed time-step: every update that fell due since
+the last tick is run (up to MAX_CATCHUP of them), each with the same DT of
+one update interval. Any updates beyond that are dropped and counted in
+DROPPED_UPDATES, and the time left over until the next update is available
+from the INTERPOLATE property.
+
+Running faster than real time:
+
+    clock = GameClock(time_source=VirtualTime())
+
+A VirtualTime time source does not follow the wall clock at all. Instead,
+it moves forward by exactly one update interval at the start of every tick,
+so every tick runs one update, and the clock never sleeps while waiting
+for the next one. This is useful for running a game with no one watching,
+as fast as the CPU allows.
+
 The frame_callback receives a single INTERPOLATION argument, which is the
 fractional position in time of the frame within the current update time-
 step. It is a float in the range 0.0 to 1.0.
@@ -109,18 +139,58 @@ GameClock.schedule_interval.
 """
 
 import time
+from heapq import heappush, heappop, heapify
+from itertools import count
+
+from designer.utilities.phase_timings import _PhaseTimings
 
 
 class _IntervalItem(object):
-    """An interval item runs after an elapsed interval."""
-    __slots__ = ['func', 'interval', 'lasttime', 'life', 'args']
+    """
+    An interval item runs after an elapsed interval. It is also the handle
+    returned when scheduling, so that it can be cancelled later.
+    """
+    __slots__ = ['func', 'interval', 'lasttime', 'life', 'args', 'clock', 'cancelled', 'queued']
 
-    def __init__(self, func, interval, curtime, life, args):
+    def __init__(self, func, interval, curtime, life, args, clock=None):
         self.func = func
         self.interval = float(interval)
         self.lasttime = curtime
         self.life = life
         self.args = args
+        self.clock = clock
+        self.cancelled = False
+        # Whether the item is waiting in its clock's heap
+        self.queued = False
+
+    @property
+    def due(self):
+        return self.lasttime + self.interval
+
+    def cancel(self):
+        """Stops this item from running again. Cancelling twice is harmless."""
+        if not self.cancelled:
+            self.cancelled = True
+            if self.clock is not None:
+                self.clock._cancelled(self)
+
+
+class VirtualTime(object):
+    """
+    A time source that only moves forward when it is told to. A GameClock
+    using one advances it by one update interval every tick.
+    """
+    __slots__ = ['now']
+
+    def __init__(self, start=0.0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        """Moves the time forward by the given number of seconds."""
+        self.now += seconds
 
 
 class GameClock:
@@ -132,12 +202,17 @@ class GameClock:
     Attribute       Description
     =============== ============
     get_ticks       The time source for the game. Should support at least
-                    subsecond accuracy.
+                    subsecond accuracy. If it is a VirtualTime, it is
+                    advanced by one update interval every tick.
     max_ups         The maximum number of updates per second. The clock
                     will prioritize trying to keep the number of
                     updates per second at this level, at the cost of
                     frames per second
     max_fps         The maximum number of frames per second.
+    max_catchup     The most updates to run in a single tick when the
+                    game has fallen behind. At 1 (the default), the
+                    clock never catches up and game time slows down
+                    instead.
     use_wait        Boolean which represents whether the clock should
                     try to sleep when possible. Setting this to False
                     will give better game performance on lower end
@@ -168,12 +243,17 @@ class GameClock:
                     five seconds
     fps             Average number of frames per second over the last
                     five seconds
+    dropped_updates The total number of updates skipped because more
+                    than max_catchup were due at once
+    timings         Rolling histograms of how long each phase of the
+                    game loop took, filled in by the director and scene
     =============== ============
     """
 
     def __init__(self,
                  max_ups=30,
                  max_fps=0,
+                 max_catchup=1,
                  use_wait=False,
                  time_source=time.time,
                  update_callback=None,
@@ -184,6 +264,7 @@ class GameClock:
         self.get_ticks = time_source
         self.max_ups = max_ups
         self.max_fps = max_fps
+        self.max_catchup = max_catchup
         self.use_wait = use_wait
         self.update_callback = update_callback
         self.frame_callback = frame_callback
@@ -199,15 +280,24 @@ class GameClock:
         self._last_frame = CURRENT_TIME
         self._next_frame = CURRENT_TIME
         self._next_second = CURRENT_TIME
-        self._update_ready = False
+        self._updates_due = 0
         self._frame_ready = False
-        #        self._frame_skip = 0
+        self._frame_skip = 0
         self._paused = 0
+        # Whether the next tick should run an update right away, forgetting
+        # any that fell due while the clock wasn't ticking
+        self._restarting = True
 
         # Schedules
-        self._need_sort = False
+        # A heap of (due time, order added, item) entries
         self._schedules = []
-        self._unschedules = []
+        self._schedule_order = count()
+        # The pending items for each function (as ordered sets), so they can
+        # be unscheduled
+        self._scheduled_funcs = {}
+        self._cancelled_count = 0
+        # When the schedules were held, or None if they are running
+        self._held = None
 
         # Metrics: update and frame progress counter in the current one-second
         # interval.
@@ -223,6 +313,10 @@ class GameClock:
         # seconds.
         self.ups = 0.0
         self.fps = 0.0
+        # Metrics: updates that were due but skipped while catching up.
+        self.dropped_updates = 0
+        # Metrics: recent durations of each phase of the game loop.
+        self.timings = _PhaseTimings()
 
     @property
     def max_ups(self):
@@ -252,15 +346,29 @@ class GameClock:
 
     @property
     def interpolate(self):
-        interp = (self._real_time - self._last_update_real)
+        if self._max_catchup > 1:
+            # The fraction of the current time-step already used up
+            interp = self._real_time - (self._next_update - self._update_interval)
+        else:
+            interp = (self._real_time - self._last_update_real)
         interp = interp / self._update_interval
-        return interp if interp <= 1.0 else 1.0
+        return min(max(interp, 0.0), 1.0)
+
+    @property
+    def max_catchup(self):
+        return self._max_catchup
+
+    @max_catchup.setter
+    def max_catchup(self, val):
+        self._max_catchup = max(1, int(val))
 
     def tick(self):
         """
         Should be called in a loop, will run and handle timers.
         """
         # Now.
+        if isinstance(self.get_ticks, VirtualTime):
+            self.get_ticks.advance(self._update_interval)
         real_time = self.get_ticks()
         self._real_time = real_time
 
@@ -273,7 +381,24 @@ class GameClock:
         # Check if update and frame are due.
         update_interval = self._update_interval
         game_time = self._game_time
-        if real_time >= self._next_update:
+        if self._restarting:
+            self._next_update = real_time
+            self._restarting = False
+        if real_time >= self._next_update and self._max_catchup > 1:
+            # Fixed time-step: run every update that is due, within reason
+            due = int((real_time - self._next_update) / update_interval) + 1
+            updates = min(due, self._max_catchup)
+            self.dropped_updates += due - updates
+            self.dt_update = update_interval
+            self._last_update_real = real_time
+            game_time += updates * update_interval
+            self._game_time = game_time
+            self._last_update = game_time
+            self._next_update += due * update_interval
+            self.num_updates += updates
+            if self.update_callback:
+                self._updates_due = updates
+        elif real_time >= self._next_update:
             self.dt_update = real_time - self._last_update_real
             self._last_update_real = real_time
             game_time += update_interval
@@ -282,7 +407,7 @@ class GameClock:
             self._next_update = real_time + update_interval
             self.num_updates += 1
             if self.update_callback:
-                self._update_ready = True
+                self._updates_due = 1
         # ORIG
         #        if (real_time + self.cost_of_frame < self._next_update) and
         #            (real_time >= self._next_frame):
@@ -327,14 +452,13 @@ class GameClock:
         # Check if a schedule is due, and when.
         sched_ready = False
         sched_due = 0
-        if self._schedules:
-            sched = self._schedules[0]
-            sched_due = sched.lasttime + sched.interval
+        if self._schedules and self._held is None:
+            sched_due = self._schedules[0][0]
             if real_time >= sched_due:
                 sched_ready = True
 
         # Run schedules if any are due.
-        if self._update_ready or sched_ready:
+        if self._updates_due or sched_ready:
             self._run_schedules()
 
         # Run the frame callback (moved inline to reduce function calls).
@@ -350,7 +474,7 @@ class GameClock:
             self._flip(real_time)
 
         # Sleep to save CPU.
-        if self.use_wait:
+        if self.use_wait and not isinstance(self.get_ticks, VirtualTime):
             upcoming_events = [
                 self._next_frame,
                 self._next_update,
@@ -364,6 +488,16 @@ class GameClock:
             if time_to_sleep >= 0.002:
                 time.sleep(time_to_sleep)
 
+    def restart(self):
+        """
+        Forgets any updates that fell due while the clock was not being
+        ticked (for instance, while the game was starting up, or while another
+        scene was running), so that they are not all caught up on at once.
+        The next tick runs one update, and the ones after that follow on at
+        the usual interval.
+        """
+        self._restarting = True
+
     def pause(self):
         """Pause the clock so that time does not elapse.
 
@@ -381,17 +515,44 @@ class GameClock:
         """Resume the clock from the point that it was paused."""
         real_time = self.get_ticks()
         paused = self._paused
-        for item in self._schedules:
-            delta = paused - item.lasttime
-            item.lasttime = real_time - delta
+        self._shift_schedules(real_time - paused)
         self._last_update_real = real_time - (paused - self._last_update_real)
+        # Updates that were already overdue when the clock was paused are not
+        # caught up on, so the next one is due within one interval
+        remaining = min(max(self._next_update - paused, 0), self._update_interval)
+        self._next_update = real_time + remaining
         self._paused = 0
         self._real_time = real_time
 
+    def hold_schedules(self):
+        """
+        Stops the scheduled items from running, while updates and frames carry
+        on as usual. Time does not pass for the scheduled items until
+        release_schedules() is called, so each one runs just as long after it
+        was scheduled as it would have without the hold.
+        """
+        if self._held is None:
+            self._held = self.get_ticks()
+
+    def release_schedules(self):
+        """Lets the scheduled items run again after hold_schedules()."""
+        if self._held is not None:
+            self._shift_schedules(self.get_ticks() - self._held)
+            self._held = None
+
+    def _shift_schedules(self, shift):
+        """Makes every scheduled item due the given number of seconds later."""
+        # Shifting every due time equally keeps the heap in order
+        for item in self._scheduled_items():
+            item.lasttime += shift
+        self._schedules = [(due + shift, order, item)
+                           for due, order, item in self._schedules]
+
     def schedule_interval(self, func, interval, life=0, args=None):
         """
 
         Schedule an item to be called back each time an interval elapses.
+        Any other schedules for the same function are removed first.
 
         While the clock is paused time does not pass.
 
@@ -407,58 +568,109 @@ class GameClock:
         if args is None:
             args = []
         self.unschedule(func)
-        item = _IntervalItem(
-            func, interval, self.get_ticks(), life, [interval] + list(args))
-        self._schedules.append(item)
-        self._need_sort = True
+        return self.schedule(func, interval, life, [interval] + list(args))
+
+    def schedule(self, func, interval, life=0, args=()):
+        """
+
+        Schedule an item to be called back each time an interval elapses,
+        alongside any other schedules for the same function. Unlike
+        schedule_interval, the interval is not passed to the callback.
+
+        | *func*: The callback function.
+        | *interval*: The time in seconds (float) between calls.
+        | *life*: The number of times the callback will fire, or 0 to keep
+          firing until cancelled.
+        | *args*: The arguments to call the callback with.
+
+        Returns the scheduled item, which has a *cancel* method.
+
+        """
+        item = _IntervalItem(func, interval, self.get_ticks(), life, list(args), self)
+        self._scheduled_funcs.setdefault(func, {})[item] = None
+        heappush(self._schedules, (item.due, next(self._schedule_order), item))
+        item.queued = True
+        return item
 
     def unschedule(self, func):
         """Unschedule a managed function."""
-        sched = self._schedules
-        for item in list(sched):
-            if item.func == func:
-                sched.remove(item)
+        for item in list(self._scheduled_funcs.get(func, ())):
+            item.cancel()
+
+    def _scheduled_items(self):
+        return [item for items in self._scheduled_funcs.values() for item in items]
+
+    def _forget(self, item):
+        """Drops a finished or cancelled item from the per-function index."""
+        items = self._scheduled_funcs.get(item.func)
+        if items is not None and item in items:
+            del items[item]
+            if not items:
+                del self._scheduled_funcs[item.func]
 
-    @staticmethod
-    def _interval_item_sort_key(item):
-        return item.lasttime + item.interval
+    def _cancelled(self, item):
+        """
+        Called when an item is cancelled. It stays in the heap until it is
+        popped, unless cancelled items have come to outnumber the live ones.
+        Items that are not in the heap (because they are running, or have
+        finished) are only forgotten.
+        """
+        self._forget(item)
+        if not item.queued:
+            return
+        self._cancelled_count += 1
+        schedules = self._schedules
+        if self._cancelled_count > 32 and self._cancelled_count * 2 > len(schedules):
+            for entry in schedules:
+                if entry[2].cancelled:
+                    entry[2].queued = False
+            schedules[:] = [entry for entry in schedules if not entry[2].cancelled]
+            heapify(schedules)
+            self._cancelled_count = 0
 
     def _run_schedules(self):
         get_ticks = self.get_ticks
 
-        # Run the update callback.
-        if self.update_callback and self._update_ready:
+        # Run the update callback, as many times as updates are due.
+        if self.update_callback and self._updates_due:
+            updates = self._updates_due
             t = get_ticks()
-            self.update_callback(self.dt_update)
-            self.cost_of_update = get_ticks() - t
-            self._update_ready = False
-
-        # Run the interval callbacks.
-        if self._need_sort:
-            self._schedules.sort(key=self._interval_item_sort_key)
-            self._need_sort = False
+            for _ in range(updates):
+                self.update_callback(self.dt_update)
+            self.cost_of_update = (get_ticks() - t) / updates
+            self._updates_due = 0
+        if self._held is not None:
+            return
+
+        # Run the interval callbacks. Each item runs at most once per tick,
+        # so items are only pushed back onto the heap once the due ones have
+        # all been popped.
+        schedules = self._schedules
         real_time = self._real_time
-        for sched in self._schedules:
-            interval = sched.interval
-            due = sched.lasttime + interval
-            if real_time >= due:
-                sched.func(*sched.args)
-                sched.lasttime += interval
-                need_sort = True
-                if sched.life > 0:
-                    if sched.life == 1:
-                        self._unschedules.append(sched.func)
-                        need_sort = False
-                    else:
-                        sched.life -= 1
-                if need_sort:
-                    self._need_sort = True
-            else:
-                break
-        if self._unschedules:
-            for func in self._unschedules:
-                self.unschedule(func)
-            del self._unschedules[:]
+        rescheduled = []
+        while schedules and schedules[0][0] <= real_time:
+            due, order, item = heappop(schedules)
+            item.queued = False
+            if item.cancelled:
+                self._cancelled_count -= 1
+                continue
+            item.func(*item.args)
+            item.lasttime = due
+            if item.cancelled:
+                # The callback cancelled its own item
+                continue
+            if item.life == 1:
+                item.cancelled = True
+                self._forget(item)
+                continue
+            if item.life > 1:
+                item.life -= 1
+            rescheduled.append((item.due, order, item))
+        for entry in rescheduled:
+            # A later callback may have cancelled an earlier item
+            if not entry[2].cancelled:
+                heappush(schedules, entry)
+                entry[2].queued = True
 
     def _flip(self, real_time):
         self.ups = self.num_updates
@@ -1,4 +1,5 @@
 import os
+from time import perf_counter
 from typing import List
 
 import pygame
@@ -15,15 +16,27 @@ from designer.keyboard import KeyboardModule
 from designer.mouse import MouseModule
 from designer.music import MusicModule
 from designer.sfx import SfxModule
+from designer.utilities.dirty_regions import _DirtyRegions
 
 DEFAULT_WINDOW_TITLE = os.environ.get('DESIGNER_WINDOW_TITLE', "Designer Game")
 DEFAULT_WINDOW_WIDTH = os.environ.get('DESIGNER_WINDOW_WIDTH', 800)
 DEFAULT_WINDOW_HEIGHT = os.environ.get('DESIGNER_WINDOW_HEIGHT', 600)
+DEFAULT_MAX_CATCHUP = int(os.environ.get('DESIGNER_MAX_CATCHUP', 1))
+DEFAULT_UPS = os.environ.get('DESIGNER_UPS', None)
+DEFAULT_INTERPOLATION = os.environ.get('DESIGNER_INTERPOLATION', '').lower() in ('1', 'true', 'yes', 'on')
+DEFAULT_HEADLESS = os.environ.get('DESIGNER_HEADLESS', '').lower() in ('1', 'true', 'yes', 'on')
+DEFAULT_RENDER_EVERY = os.environ.get('DESIGNER_RENDER_EVERY', 1)
+DEFAULT_SHOW_TIMINGS = os.environ.get('DESIGNER_SHOW_TIMINGS', '').lower() in ('1', 'true', 'yes', 'on')
+DEFAULT_MAX_DIRTY_RECTS = int(os.environ.get('DESIGNER_MAX_DIRTY_RECTS', _DirtyRegions.MAX_RECTS))
+DEFAULT_FULL_UPDATE_FRACTION = float(os.environ.get('DESIGNER_FULL_UPDATE_FRACTION',
+                                                    _DirtyRegions.FULL_UPDATE_FRACTION))
 
 
 class Director:
     def __init__(self, width=DEFAULT_WINDOW_WIDTH, height=DEFAULT_WINDOW_HEIGHT,
-                 background_color=(255, 255, 255, 255), fps=30):
+                 background_color=(255, 255, 255, 255), fps=30, max_catchup=DEFAULT_MAX_CATCHUP,
+                 ups=DEFAULT_UPS, interpolation=DEFAULT_INTERPOLATION,
+                 headless=DEFAULT_HEADLESS, render_every=DEFAULT_RENDER_EVERY):
         """
         Initializes the Director that will control the game state.
 
@@ -32,12 +45,44 @@ class Director:
         :param height: height of the game window in pixels
         :type height: int
         :param background_color: color to initially fill the window with
+        :param max_catchup: the most updates to run at once when the game falls
+                            behind, so that game time keeps up with real time;
+                            by default 1, so game time slows down instead
+        :type max_catchup: int
+        :param ups: how many times to update the game each second; by default,
+                    the same as the `fps`
+        :type ups: int
+        :param interpolation: whether to draw moving objects part of the way
+                              between their last two updates, so that motion
+                              looks smooth even when there are fewer updates
+                              than frames
+        :type interpolation: bool
+        :param headless: whether to run without a real window, using a virtual
+                         clock that runs every update immediately after the
+                         last one instead of waiting for real time to pass
+        :type headless: bool
+        :param render_every: only draw one out of this many frames; 0 means
+                             never draw at all
+        :type render_every: int
         """
+        self.headless = bool(headless)
+        if self.headless:
+            os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+            os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
         pygame.init()
         self._window_size = int(width), int(height)
         self._window_title = DEFAULT_WINDOW_TITLE
         self._window_color = background_color
         self._fps = fps
+        self._max_catchup = int(max_catchup)
+        self._ups = int(ups) if ups else fps
+        self.interpolation = bool(interpolation)
+        self.render_every = int(render_every)
+        #: Whether to draw the phase timings over the corner of the window
+        self.show_timings = DEFAULT_SHOW_TIMINGS
+        self._max_dirty_rects = DEFAULT_MAX_DIRTY_RECTS
+        self._full_update_fraction = DEFAULT_FULL_UPDATE_FRACTION
+        self._frames = 0
         self._tick = 0
         self.running = False
         self.paused = False
@@ -51,6 +96,8 @@ class Director:
         self.scene_name = ""
         self._scenes: List[Scene] = []
         self._delayed_event_registrations = {None: []}
+        #: The classes and layer names used in collision events, by name
+        self._collision_kinds = {}
         self._scene_changed = False
 
         self.screen = pygame.display.set_mode(self.window_size)
@@ -63,7 +110,7 @@ class Director:
         self.sfx = SfxModule()
 
     def _setup_initial_scene(self):
-        new_scene = Scene(self._window_size, self._fps)
+        new_scene = Scene(self._window_size, self._ups, self._fps)
         self._scenes.append(new_scene)
         register("system.quit", self.stop)
         new_scene._register_default_events()
@@ -91,6 +138,64 @@ class Director:
     def fps(self):
         return self._fps
 
+    @property
+    def ups(self):
+        return self._ups
+
+    @ups.setter
+    def ups(self, value):
+        self._ups = int(value)
+        for scene in self._scenes:
+            scene.clock.max_ups = self._ups
+
+    @property
+    def max_catchup(self):
+        return self._max_catchup
+
+    @max_catchup.setter
+    def max_catchup(self, value):
+        self._max_catchup = int(value)
+        for scene in self._scenes:
+            scene.clock.max_catchup = self._max_catchup
+
+    @property
+    def max_dirty_rects(self):
+        """
+        The most separate rects sent to the display in one frame; when more
+        parts of the window than this changed, the whole window is updated.
+        """
+        return self._max_dirty_rects
+
+    @max_dirty_rects.setter
+    def max_dirty_rects(self, value):
+        self._max_dirty_rects = int(value)
+        for scene in self._scenes:
+            scene._dirty_regions.max_rects = self._max_dirty_rects
+
+    @property
+    def full_update_fraction(self):
+        """
+        How much of the window (from 0 to 1) has to change in one frame before
+        the whole window is updated, rather than just the parts that changed.
+        """
+        return self._full_update_fraction
+
+    @full_update_fraction.setter
+    def full_update_fraction(self, value):
+        self._full_update_fraction = float(value)
+        for scene in self._scenes:
+            scene._dirty_regions.full_update_fraction = self._full_update_fraction
+
+    @property
+    def timings(self):
+        """
+        How long each phase of the game loop has recently been taking in the
+        current scene, as a `dict` mapping each phase (``'events'``,
+        ``'update'``, ``'render'``, ``'draw'``, and ``'display'``) to its
+        p50, p95, p99, and max durations in milliseconds.
+        """
+        return self._scenes[-1].clock.timings.summary()
+
     @property
     def current_scene(self):
         return self._scenes[-1]
@@ -168,15 +273,36 @@ class Director:
                     self._delayed_event_registrations[target] = []
                 self._delayed_event_registrations[target].append((event_namespace, handlers, args, kwargs, priority, dynamic))
 
+    def _collision_namespace(self, first, second):
+        """
+        Works out the event namespace for collisions between two kinds of
+        objects (classes or layer names), remembering which kind each name
+        stands for so that scenes can find the objects again.
+        """
+        names = []
+        for kind in (first, second):
+            if isinstance(kind, str):
+                name = kind
+            elif isinstance(kind, type):
+                name = kind.__name__
+            else:
+                raise TypeError(f"Collisions can only be watched between classes of objects or layer names, "
+                                f"not {kind!r}.")
+            if '.' in name:
+                raise ValueError(f"Collisions can't be watched for the name {name!r}, since it has a period.")
+            known = self._collision_kinds.setdefault(name, kind)
+            if known != kind:
+                raise ValueError(f"Collisions are already being watched for a different {name!r}: {known!r}.")
+            names.append(name)
+        return 'collision.' + '.'.join(names)
+
     def register_delayed_events(self, new_scene, scene_name):
+        events = []
         if scene_name in self._delayed_event_registrations:
-            events = self._delayed_event_registrations[scene_name]
-            for event in events:
-                new_scene._reg_internal(*event)
+            events.extend(self._delayed_event_registrations[scene_name])
         # Global default events
-        events = self._delayed_event_registrations[None]
-        for event in events:
-            new_scene._reg_internal(*event)
+        events.extend(self._delayed_event_registrations[None])
+        new_scene._reg_bulk(events)
 
     def change_scene(self, scene_name, kwargs):
         self._scene_changed = ('replace', scene_name, kwargs)
@@ -198,7 +324,7 @@ class Director:
             del old_scene
 
         if change_type in ('replace', 'push'):
-            new_scene = Scene(self._window_size, self._fps)
+            new_scene = Scene(self._window_size, self._ups, self._fps)
             self._scenes.append(new_scene)
             register("system.quit", self.stop)
             new_scene._register_default_events(True)
@@ -290,6 +416,17 @@ class Director:
         # Empty all events!
         pygame.event.get()
 
+    def _should_render(self):
+        """
+        Counts off another frame, and decides whether it should actually be
+        drawn given the `render_every` setting.
+
+        :rtype: bool
+        """
+        frame = self._frames
+        self._frames += 1
+        return self.render_every > 0 and frame % self.render_every == 0
+
     def debug(self, initial_game_state):
         self.debug_mode = True
         self.start(initial_game_state)
@@ -340,14 +477,22 @@ class Director:
                 if scene is not old_scene:
                     clock = scene.clock
                     old_scene = scene
+                    # Don't rush through the updates missed while this scene
+                    # was being set up, or while another scene was on top of it
+                    clock.restart()
 
                     def frame_callback(interpolation):
                         """
                         A closure for handling drawing, which includes forcing the
                         rendering-related events to be fired.
                         """
+                        if not self._should_render():
+                            return
+                        started = perf_counter()
                         scene._handle_event("director.pre_render")
                         scene._handle_event("director.render", Event(world=self.game_state))
+                        scene._render_objects(interpolation if self.interpolation else None)
+                        clock.timings.record('render', perf_counter() - started)
                         scene._draw()
                         scene._handle_event("director.post_render")
 
@@ -370,14 +515,22 @@ class Director:
                             scene.redraw()
                             scene._handle_event("director.redraw")
 
+                        started = perf_counter()
                         scene._event_source.tick()
                         events = scene._event_source.get()
                         for event in events:
                             scene._queue_event(*_pygame_to_spyral(event, world=self.game_state))
                         scene._handle_event("director.pre_update")
+                        updating = perf_counter()
+                        # The input handlers run inside director.update, so
+                        # their time is moved over to the events phase
+                        scene._events_elapsed = 0.0
                         scene._handle_event('director.update', Event(world=self.game_state, delta=delta))
                         self._tick += 1
                         scene._handle_event("director.post_update")
+                        handling = scene._events_elapsed
+                        clock.timings.record('events', updating - started + handling)
+                        clock.timings.record('update', perf_counter() - updating - handling)
 
                     clock.frame_callback = frame_callback
                     clock.update_callback = update_callback
@@ -399,6 +552,12 @@ class Director:
 
     def pause(self, new_state=True):
         self.paused = new_state
+        # Timers run on game time, which stands still while the game is paused
+        for scene in self._scenes:
+            if new_state:
+                scene.clock.hold_schedules()
+            else:
+                scene.clock.release_schedules()
 
     def restart(self):
         # TODO: This logic should adjust to new game starting concept
@@ -135,7 +135,11 @@ _TYPE_TO_TYPE = {
 KNOWN_EVENTS = [*_TYPE_TO_TYPE.values(), *COMMON_EVENT_NAMES.keys()]
 
 
-def get_positional_event_parameters(event_type: str, event):
+def _known_positional_event_parameters(event_type: str):
+    """
+    The positional parameters for the built-in event types, which only depend
+    on the type of the event. Returns `None` for any other event type.
+    """
     if event_type in ("updating", "director.update"):
         return "world", "delta"
     elif event_type in ("typing", ) or event_type.startswith("input.keyboard"):
@@ -148,9 +152,115 @@ def get_positional_event_parameters(event_type: str, event):
         return "scene",
     elif event_type in ("director.scene.enter", "director.scene.exit"):
         return "world", "scene",
+    elif event_type.startswith("collision."):
+        return "world", "first", "second"
+    return None
+
+
+def get_positional_event_parameters(event_type: str, event):
+    known = _known_positional_event_parameters(event_type)
+    if known is not None:
+        return known
     return [key for key in dir(event) if not key.startswith("__")]
 
 
+def _missing_event_parameter(event_type, event, name):
+    """
+    Builds the error for a handler that asked for a parameter the event does
+    not provide.
+    """
+    friendly_event_name = COMMON_EVENT_NAME_LOOKUP.get(event_type, event_type)
+    suggestions = ", ".join(map(repr, [k for k in dir(event) if not k.startswith("__")]))
+    return TypeError(f"Your event handler function expected a parameter named {name!r}, but "
+                     f"the event {friendly_event_name!r} does not provide an argument with that name. "
+                     f"The parameters allowed for this event are: {suggestions}")
+
+
+_MISSING = object()
+
+
+class _HandlerBinder:
+    """
+    Works out how to call an event handler. The handler's signature is only
+    inspected once, when the handler is registered, so that dispatching an
+    event just has to look up each parameter on the event.
+
+    Parameters are filled in by name from the event's attributes (or the event
+    itself, for a parameter named ``event``), then from the parameter's
+    default, and finally by position from the event type's positional
+    parameters.
+
+    :param handler: The handler function that will be called.
+    :type handler: callable
+    """
+    __slots__ = ['parameters', 'inspectable', '_fallbacks']
+
+    def __init__(self, handler):
+        try:
+            funct = handler.func
+        except AttributeError:
+            funct = handler
+        try:
+            signature = inspect.signature(funct)
+        except Exception:
+            # Some builtins can't be inspected; they get called without arguments
+            self.inspectable = False
+            self.parameters = ()
+        else:
+            self.inspectable = True
+            parameters = [(p.name, p.default) for p in signature.parameters.values()]
+            if parameters and parameters[0][0] == 'self':
+                parameters.pop(0)
+            self.parameters = tuple(parameters)
+        self._fallbacks = {}
+
+    def _positional_fallbacks(self, event_type, event):
+        """
+        Matches up each of the handler's parameters with the event attribute
+        at the same position, or `None` if there is no attribute there. Built-in
+        event types always have the same positional parameters, so their
+        matches are remembered.
+        """
+        fallbacks = self._fallbacks.get(event_type)
+        if fallbacks is not None:
+            return fallbacks
+        known = _known_positional_event_parameters(event_type)
+        positional = known if known is not None else get_positional_event_parameters(event_type, event)
+        fallbacks = tuple(positional[index] if index < len(positional) else None
+                          for index in range(len(self.parameters)))
+        if known is not None:
+            self._fallbacks[event_type] = fallbacks
+        return fallbacks
+
+    def bind(self, event, event_type):
+        """
+        Collects the arguments to call the handler with for this event.
+
+        :param event: The event being dispatched.
+        :type event: :class:`Event <designer.core.event.Event>`
+        :param str event_type: The type of the event being dispatched.
+        :returns: A `list` of positional arguments.
+        """
+        args = []
+        fallbacks = None
+        for index, (name, default) in enumerate(self.parameters):
+            if name == 'event':
+                args.append(event)
+                continue
+            value = getattr(event, name, _MISSING)
+            if value is _MISSING:
+                if default is not inspect.Parameter.empty:
+                    value = default
+                else:
+                    if fallbacks is None:
+                        fallbacks = self._positional_fallbacks(event_type, event)
+                    if fallbacks[index] is None:
+                        raise _missing_event_parameter(event_type, event, name)
+                    value = getattr(event, fallbacks[index])
+            args.append(value)
+        return args
+
+
 def queue(event_name, event=None):
     """
     Queues a new event in the system, meaning that it will be run at the next
@@ -1,6 +1,7 @@
 import pygame
 import copy
 import math
+from itertools import count
 
 from pygame import Rect as pygame_rect
 from designer.utilities.vector import Vec2D
@@ -115,6 +116,7 @@ class InternalImage:
                           not specify a filename, you *must* pass in a size.
 
     """
+    _KEYS = count()
 
     def __init__(self, filename=None, size=None, fileobj=None):
         if size is not None and filename is not None:
@@ -131,6 +133,17 @@ class InternalImage:
                 fileobj = filename
             self._surf = pygame.image.load(fileobj).convert_alpha()
         self._version = 1
+        #: Identifies the contents of this image; copies share it until one
+        #: of them is changed
+        self._key = next(InternalImage._KEYS)
+
+    def _modified(self):
+        """
+        Marks this internal_image as changed, so that nothing cached for its
+        old contents (or for unchanged copies of it) is used for it again.
+        """
+        self._version += 1
+        self._key = next(InternalImage._KEYS)
 
     def _get_width(self):
         return self._surf.get_width()
@@ -165,7 +178,7 @@ class InternalImage:
         :returns: This internal_image.
         """
         self._surf.fill(color)
-        self._version += 1
+        self._modified()
         scale_surface.clear(self._surf)
         return self
 
@@ -198,7 +211,7 @@ class InternalImage:
         offset = self._calculate_offset(anchor, rect.size)
         target = pygame_rect(rect.pos + offset, rect.size)
         pygame.draw.rect(self._surf, color, target, border_width)
-        self._version += 1
+        self._modified()
         scale_surface.clear(self._surf)
         return self
 
@@ -223,7 +236,7 @@ class InternalImage:
             pygame.draw.aalines(self._surf, color, closed, points)
         else:
             pygame.draw.lines(self._surf, color, closed, points, width)
-        self._version += 1
+        self._modified()
         scale_surface.clear(self._surf)
         return self
 
@@ -246,7 +259,7 @@ class InternalImage:
         offset = self._calculate_offset(anchor)
         pygame.draw.circle(self._surf, color, tuple((Vec2D(position) + Vec2D(offset)).floor()),
                            radius, width)
-        self._version += 1
+        self._modified()
         scale_surface.clear(self._surf)
         return self
 
@@ -278,7 +291,7 @@ class InternalImage:
         offset = self._calculate_offset(anchor, rect.size)
         pygame.draw.ellipse(self._surf, color,
                             pygame_rect(rect.pos + offset, rect.size), border_width)
-        self._version += 1
+        self._modified()
         scale_surface.clear(self._surf)
         return self
 
@@ -297,7 +310,7 @@ class InternalImage:
         """
         offset = self._calculate_offset(anchor)
         self._surf.set_at(position + offset, color)
-        self._version += 1
+        self._modified()
         scale_surface.clear(self._surf)
         return self
 
@@ -331,7 +344,7 @@ class InternalImage:
         offset = self._calculate_offset(anchor, rect.size)
         pygame.draw.arc(self._surf, color, pygame_rect(rect.pos + offset, rect.size),
                         start_angle, end_angle, border_width)
-        self._version += 1
+        self._modified()
         scale_surface.clear(self._surf)
         return self
 
@@ -349,7 +362,7 @@ class InternalImage:
         """
         offset = self._calculate_offset(anchor, internal_image._surf.get_size())
         self._surf.blit(internal_image._surf, position + offset)
-        self._version += 1
+        self._modified()
         scale_surface.clear(self._surf)
         return self
 
@@ -367,7 +380,7 @@ class InternalImage:
         """
         offset = self._calculate_offset(anchor, surf.get_size())
         self._surf.blit(surf, position + offset)
-        self._version += 1
+        self._modified()
         scale_surface.clear(self._surf)
         return self
 
@@ -383,7 +396,7 @@ class InternalImage:
         :returns: This internal_image.
         """
         self._surf = pygame.transform.rotate(self._surf, angle).convert_alpha()
-        self._version += 1
+        self._modified()
         return self
 
     def scale(self, size):
@@ -395,7 +408,7 @@ class InternalImage:
         :returns: This internal_image.
         """
         self._surf = pygame.transform.smoothscale(self._surf, tuple(size)).convert_alpha()
-        self._version += 1
+        self._modified()
         return self
 
     def flip(self, flip_x=True, flip_y=True):
@@ -406,7 +419,7 @@ class InternalImage:
         :param bool flip_y: whether to flip vertically.
         :returns: This internal_image.
         """
-        self._version += 1
+        self._modified()
         self._surf = pygame.transform.flip(self._surf,
                                            flip_x, flip_y).convert_alpha()
         return self
@@ -448,7 +461,7 @@ class InternalImage:
         new = DesignerSurface(size)
         new.blit(self._surf, (0, 0), (rect.pos, rect.size))
         self._surf = new
-        self._version += 1
+        self._modified()
         return self
 
     def _calculate_offset(self, anchor_type, size=(0, 0)):
@@ -2,26 +2,84 @@ from typing import Optional
 
 import pygame
 import time
+from time import perf_counter
 import operator
-import inspect
 import sys
+from bisect import bisect_left, bisect_right
 
 try:
-    from weakref import ref as _wref, WeakMethod
+    from weakref import ref as _wref, WeakMethod, finalize
 except ImportError:
     _wref = lambda x: x
     WeakMethod = lambda x: x
+    finalize = lambda *args: None
 
 import designer
-from itertools import chain
+from itertools import chain, islice
 
-from designer.core.event import COMMON_EVENT_NAME_LOOKUP, get_positional_event_parameters
+from designer.core.event import Event, _HandlerBinder, _missing_event_parameter, _MISSING
 from designer.core.internal_image import InternalImage
 from designer.utilities.layer_tree import _LayerTree
+from designer.utilities.spatial_grid import _SpatialGrid
+from designer.utilities.dirty_regions import _DirtyRegions
+from designer.utilities.phase_timings import _TimingsOverlay
+from designer.utilities.rotation_sheets import _render_sheet_frames
+from designer.utilities.batch_collision import _colliding_candidates, _boxes_collide
+from designer.utilities.collision_shapes import _refine_collision, _refine_point
+from designer.utilities.rect import Rect
 from collections import defaultdict
-from designer.core.clock import GameClock
+from designer.core.clock import GameClock, VirtualTime
 from designer.utilities.weak_functions import weak_function
 
+#: Blits are drawn in order of their layer, then of their object's creation
+_blit_order = operator.attrgetter('layer', 'id')
+
+#: Collision events are sent in the order their objects were created
+_creation_order = operator.attrgetter('_id')
+
+#: Handlers are sorted by their priority, the fourth item of their entry
+_handler_priority = operator.itemgetter(3)
+
+
+def _insert_by_priority(handlers, entry):
+    """
+    Inserts the handler entry into the already sorted list of handlers, after
+    any others with the same priority.
+    """
+    priority = entry[3]
+    low, high = 0, len(handlers)
+    while low < high:
+        middle = (low + high) // 2
+        if priority < handlers[middle][3]:
+            high = middle
+        else:
+            low = middle + 1
+    handlers.insert(low, entry)
+
+
+def _forget_object_handlers(scene_ref, key):
+    """
+    Drops the handler index of an object that has just been garbage
+    collected, if its scene is still around.
+    """
+    scene = scene_ref()
+    if scene is not None:
+        scene._object_handlers.pop(key, None)
+
+
+def _is_kind(obj, kind):
+    """
+    Whether the object is of the given kind, for collision events: either an
+    instance of a class, or on a layer with the given name.
+    """
+    if isinstance(kind, str):
+        return obj._layer == kind
+    return isinstance(obj, kind)
+
+
+#: Newer versions of pygame offer a faster blits that only takes (source, dest)
+_HAS_FBLITS = hasattr(pygame.Surface, 'fblits')
+
 
 def _has_value(obj, collect):
     for item in collect:
@@ -54,19 +112,35 @@ class Scene:
     """
 
     def __init__(self, size=None, max_ups=None, max_fps=None):
-        time_source = time.time
+        if designer.GLOBAL_DIRECTOR.headless:
+            # Run updates back to back, without waiting on the wall clock
+            time_source = VirtualTime()
+        else:
+            time_source = time.time
         self.clock = GameClock(
             time_source=time_source,
             max_fps=max_fps or designer.GLOBAL_DIRECTOR.fps,
-            max_ups=max_ups or designer.GLOBAL_DIRECTOR.fps)
+            max_ups=max_ups or designer.GLOBAL_DIRECTOR.ups,
+            max_catchup=designer.GLOBAL_DIRECTOR.max_catchup)
         self.clock.use_wait = True
+        if designer.GLOBAL_DIRECTOR.paused:
+            self.clock.hold_schedules()
 
         self._handlers = defaultdict(lambda: [])
         self._namespaces = set()
+        # The namespaces matching each event type fired so far; reset whenever
+        # a new namespace is added
+        self._namespace_cache = {}
+        # The collisions that handlers are waiting for; reset with the namespace cache
+        self._collision_subscription_cache = None
+        # The (namespace, entry) pairs of every handler bound to each object,
+        # by the id of the object (which might not be hashable)
+        self._object_handlers = {}
         self._event_source = designer.core.event.LiveEventHandler()
         self._handling_events = False
         self._events = []
         self._pending = []
+        self._events_elapsed = 0.0
         self._debug = True
 
         self._scale = designer.utilities.vector.Vec2D(1.0, 1.0)  # None
@@ -88,14 +162,30 @@ class Scene:
         self._clear_next_frame = []
         self._soft_clear = []
         self._static_blits = {}
+        self._static_grid = _SpatialGrid()
+        # Static blits kept in drawing order, alongside their sort keys
+        self._static_order = []
+        self._static_order_keys = []
         self._invalidating_views = {}
+        # The views each object was added to in _invalidating_views
+        self._object_views = {}
         self._collision_boxes = {}
+        self._collision_grid = _SpatialGrid()
+        # Objects that have changed since their collision box was last computed
+        self._stale_collision_boxes = {}
+        # Objects whose images need to be redrawn before they are next used
+        self._pending_redraws = {}
         self._rect = self._surface.get_rect()
+        self._dirty_regions = _DirtyRegions(self._rect, designer.GLOBAL_DIRECTOR.max_dirty_rects,
+                                            designer.GLOBAL_DIRECTOR.full_update_fraction)
+        self._timings_overlay = None
 
         self._layers = []
         self._child_views = []
         self._layer_tree = _LayerTree(self)
         self._objects = set()
+        # Live objects to render each frame, in the order they were added
+        self._renderables = {}
 
         self._game_state = None
 
@@ -107,10 +197,13 @@ class Scene:
 
     def _register_default_events(self, force=False):
         if not self._events_activated or force:
-            for redraw_event in ['director.scene.enter', 'system.video_resize', 'system.video_expose', 'system.focus_change']:
-                self.register(redraw_event, self.redraw)
-            self.register('director.update', self._handle_events)
-            self.register('designer.internal.view.changed', self._invalidate_views)
+            redraw_events = ['director.scene.enter', 'system.video_resize', 'system.video_expose', 'system.focus_change']
+            self._reg_bulk([(redraw_event, (self.redraw,), (), {}, 0, False) for redraw_event in redraw_events] +
+                           [('director.update', (self._handle_events,), (), {}, 0, False),
+                            ('director.post_update', (self._flush_redraws,), (), {}, 0, False),
+                            ('director.post_update', (self._dispatch_collisions,), (), {}, 0, False),
+                            ('director.post_update', (_render_sheet_frames,), (), {}, 0, False),
+                            ('designer.internal.view.changed', (self._invalidate_views,), (), {}, 0, False)])
             self._events_activated = True
 
     # Event Handling
@@ -147,45 +240,91 @@ class Scene:
         Convenience method for registering a new event; other variations
         exist to keep the signature convenient and easy.
         """
+        namespace = self._add_namespace(namespace)
+        namespace_handlers = self._handlers[namespace]
+        for handler in handlers:
+            entry = self._make_handler_entry(handler, args, kwargs, priority, dynamic)
+            _insert_by_priority(namespace_handlers, entry)
+            self._index_handler(namespace, handler, entry)
+
+    def _reg_bulk(self, registrations):
+        """
+        Registers many events at once, sorting each namespace's handlers just
+        once at the end instead of after every handler. Handlers with the same
+        priority stay in the order they were given, as with
+        :meth:`_reg_internal`.
+
+        :param registrations: The arguments for each call to :meth:`_reg_internal`.
+        :type registrations: an iterable of tuples of (namespace, handlers, args,
+                             kwargs, priority, dynamic)
+        """
+        changed = set()
+        for namespace, handlers, args, kwargs, priority, dynamic in registrations:
+            namespace = self._add_namespace(namespace)
+            namespace_handlers = self._handlers[namespace]
+            for handler in handlers:
+                entry = self._make_handler_entry(handler, args, kwargs, priority, dynamic)
+                namespace_handlers.append(entry)
+                self._index_handler(namespace, handler, entry)
+            changed.add(namespace)
+        for namespace in changed:
+            self._handlers[namespace].sort(key=_handler_priority)
+
+    def _add_namespace(self, namespace):
+        """
+        Internal method to record a namespace that handlers are being
+        registered for, returning it without any trailing wildcard.
+        """
         if namespace.endswith(".*"):
             namespace = namespace[:-2]
-        self._namespaces.add(namespace)
-        for handler in handlers:
-            self._handlers[namespace].append((weak_function(handler), args, kwargs,
-                                              priority, dynamic))
-        self._handlers[namespace].sort(key=lambda item: item[3]) # operator.itemgetter(3))
+        if namespace not in self._namespaces:
+            self._namespaces.add(namespace)
+            self._namespace_cache.clear()
+            self._collision_subscription_cache = None
+        return namespace
+
+    def _index_handler(self, namespace, handler, entry):
+        """
+        Internal method to remember which object a handler is bound to, so
+        that it can be found again quickly when that object is unregistered.
+        """
+        if isinstance(entry[0], WeakMethod):
+            owner = handler.__self__
+            entries = self._object_handlers.get(id(owner))
+            if entries is None:
+                entries = self._object_handlers[id(owner)] = []
+                finalize(owner, _forget_object_handlers, _wref(self), id(owner))
+            entries.append((namespace, entry))
+
+    @staticmethod
+    def _make_handler_entry(handler, args, kwargs, priority, dynamic):
+        """
+        Internal method to build the tuple stored for each registered handler.
+        """
+        binder = None if dynamic else _HandlerBinder(handler)
+        return weak_function(handler), args, kwargs, priority, dynamic, binder
 
     def _get_namespaces(self, namespace):
         """
         Internal method for returning all the registered namespaces that are in
-        the given namespace.
+        the given namespace. The answer only changes when a new namespace is
+        registered, so it is worked out once per namespace and remembered.
         """
-        return [n for n in self._namespaces if (namespace == n or
-                                                n.rsplit(".", 1)[0].startswith(namespace) or
-                                                namespace.rsplit(".", 1)[0].startswith(n))]
+        matches = self._namespace_cache.get(namespace)
+        if matches is None:
+            matches = tuple(n for n in sorted(self._namespaces) if (namespace == n or
+                                                                    n.rsplit(".", 1)[0].startswith(namespace) or
+                                                                    namespace.rsplit(".", 1)[0].startswith(n)))
+            self._namespace_cache[namespace] = matches
+        return matches
 
     def _send_event_to_handler(self, event, event_type, handler: callable, args,
-                               kwargs, priority, dynamic):
+                               kwargs, priority, dynamic, binder=None):
         """
-        Internal method to dispatch events to their handlers.
+        Internal method to dispatch events to their handlers. The `binder` is
+        the handler's :class:`_HandlerBinder`, normally made when it was
+        registered; if it is missing, one is made on the spot.
         """
-        def _get_arg_val(arg, default=inspect.Parameter.empty, index=None):
-            if arg == 'event':
-                return event
-            elif hasattr(event, arg):
-                return getattr(event, arg)
-            else:
-                if default != inspect.Parameter.empty:
-                    return default
-                positional_parameters = get_positional_event_parameters(event_type, event)
-                if index < len(positional_parameters):
-                    return getattr(event, positional_parameters[index])
-                friendly_event_name = COMMON_EVENT_NAME_LOOKUP.get(event_type, event_type)
-                suggestions = ", ".join(map(repr, [k for k in dir(event) if not k.startswith("__")]))
-                raise TypeError(f"Your event handler function expected a parameter named {arg!r}, but "
-                                f"the event {friendly_event_name!r} does not provide an argument with that name. "
-                                f"The parameters allowed for this event are: {suggestions}")
-
         if dynamic is True:
             original_handler = handler
             handler = self
@@ -193,42 +332,38 @@ class Scene:
                 handler = getattr(handler, piece, None)
                 if handler is None:
                     return
+            binder = None
         handler = handler()
+        if handler is None:
+            return
         if handler is sys.exit and args is None and kwargs is None:
             # Dirty hack to deal with python builtins
-            args = []
-            kwargs = {}
+            return handler()
         elif args is None and kwargs is None:
             # Autodetect the arguments
-            try:
-                funct = handler.func
-            except AttributeError as e:
-                funct = handler
-            try:
-                signature = inspect.signature(funct)
-            except Exception as e:
+            if binder is None:
+                binder = _HandlerBinder(handler)
+            if not binder.inspectable:
                 return handler()
-                #raise Exception(("Unfortunate Python Problem! "
-                #                 f"{handler} isn't supported by Python's "
-                #                 "inspect module! Oops."))
-            h_args = [p.name for p in signature.parameters.values()]
-            h_defaults = [p.default for p in signature.parameters.values()] or tuple()
-            if len(h_args) > 0 and 'self' == h_args[0]:
-                h_args.pop(0)
-            d = len(h_args) - len(h_defaults)
-            if d > 0:
-                h_defaults = [inspect.Parameter.empty] * d + list(*h_defaults)
-            args = [_get_arg_val(arg, default, index) for index, (arg, default)
-                    in enumerate(zip(h_args, h_defaults))]
-            kwargs = {}
+            return handler(*binder.bind(event, event_type))
         elif args is None:
-            args = []
-            kwargs = dict([(arg, _get_arg_val(arg)) for arg in kwargs])
+            return handler(**{arg: self._get_event_value(event, event_type, arg)
+                              for arg in kwargs})
         else:
-            args = [_get_arg_val(arg) for arg in args]
-            kwargs = {}
-        if handler is not None:
-            return handler(*args, **kwargs)
+            return handler(*[self._get_event_value(event, event_type, arg) for arg in args])
+
+    @staticmethod
+    def _get_event_value(event, event_type, name):
+        """
+        Internal method to look up a single named value from the event, for
+        handlers registered with explicit argument names.
+        """
+        if name == 'event':
+            return event
+        value = getattr(event, name, _MISSING)
+        if value is _MISSING:
+            raise _missing_event_parameter(event_type, event, name)
+        return value
 
     def _handle_event(self, event_type, event=None, collect_results=False):
         """
@@ -250,8 +385,10 @@ class Scene:
 
     def _handle_events(self):
         """
-        Run through all the events and handle them.
+        Run through all the events and handle them. The time this takes is
+        added to `_events_elapsed`, for the events phase of the timings.
         """
+        started = perf_counter()
         self._handling_events = True
         do = True
         while do or len(self._pending) > 0:
@@ -260,13 +397,32 @@ class Scene:
                 self._handle_event(type, event)
             self._events = self._pending
             self._pending = []
+        self._events_elapsed += perf_counter() - started
 
     def _unregister_object_events(self, object):
-        for name, handlers in list(self._handlers.items()):
-            self._handlers[name] = [h for h in handlers
-                                    if not hasattr(h[0], '__self__') or h[0].__self__ is not object]
-            if not self._handlers[name]:
-                del self._handlers[name]
+        """
+        Internal method to remove every handler bound to the given object.
+        Only the namespaces it has handlers in are touched, and their lists are
+        replaced rather than changed, so that any event currently being
+        dispatched is not disturbed.
+        """
+        entries = self._object_handlers.get(id(object))
+        if not entries:
+            return
+        # The (now empty) list is kept until the object is gone, which is
+        # when it is forgotten
+        self._object_handlers[id(object)] = []
+        removed = defaultdict(set)
+        for namespace, entry in entries:
+            removed[namespace].add(id(entry))
+        for namespace, entry_ids in removed.items():
+            if namespace not in self._handlers:
+                continue
+            remaining = [h for h in self._handlers[namespace] if id(h) not in entry_ids]
+            if remaining:
+                self._handlers[namespace] = remaining
+            else:
+                del self._handlers[namespace]
 
     def _unregister(self, event_namespace, handler):
         """
@@ -289,6 +445,12 @@ class Scene:
                                                             or (h[0]().__self__ is not handler.__self__)))]
         if not self._handlers[event_namespace]:
             del self._handlers[event_namespace]
+        owner = getattr(handler, '__self__', None)
+        if owner is not None and id(owner) in self._object_handlers:
+            kept = {id(h) for h in self._handlers.get(event_namespace, ())}
+            self._object_handlers[id(owner)] = [(namespace, entry) for namespace, entry
+                                                in self._object_handlers[id(owner)]
+                                                if namespace != event_namespace or id(entry) in kept]
 
     def _clear_namespace(self, namespace):
         """
@@ -309,6 +471,8 @@ class Scene:
         dangerous function, and should almost never be used.
         """
         self._handlers.clear()
+        for key in self._object_handlers:
+            self._object_handlers[key] = []
 
     def _get_event_source(self):
         """
@@ -404,12 +568,14 @@ class Scene:
         Internal method to add this object to the scene
         """
         self._objects.add(object)
+        self._renderables[object] = None
         # Add the view and its parents to the invalidating_views for the object
         parent_view = object._parent()
         while parent_view != self:
             if parent_view not in self._invalidating_views:
                 self._invalidating_views[parent_view] = set()
             self._invalidating_views[parent_view].add(object)
+            self._object_views.setdefault(object, []).append(parent_view)
             parent_view = parent_view.parent
 
     def _unregister_object(self, object):
@@ -418,10 +584,15 @@ class Scene:
         """
         if object in self._objects:
             self._objects.remove(object)
+        self._renderables.pop(object, None)
+        self._stale_collision_boxes.pop(object, None)
+        self._pending_redraws.pop(object, None)
         if object in self._collision_boxes:
             del self._collision_boxes[object]
-        for view in self._invalidating_views.keys():
-            self._invalidating_views[view].discard(object)
+            self._collision_grid.remove(object)
+        for view in self._object_views.pop(object, ()):
+            if view in self._invalidating_views:
+                self._invalidating_views[view].discard(object)
         self._unregister_object_events(object)
 
     def _destroy_view(self, view):
@@ -430,8 +601,10 @@ class Scene:
         """
         if view in self._invalidating_views:
             del self._invalidating_views[view]
+        self._stale_collision_boxes.pop(view, None)
         if view in self._collision_boxes:
             del self._collision_boxes[view]
+            self._collision_grid.remove(view)
         self._layer_tree.remove_view(view)
 
     def _blit(self, blit):
@@ -450,7 +623,14 @@ class Scene:
         """
         blit.apply_scale(self._scale)
         blit.finalize()
+        if key in self._static_blits:
+            self._forget_static_blit(self._static_blits[key])
         self._static_blits[key] = blit
+        self._static_grid.insert(blit, blit.rect)
+        order = _blit_order(blit)
+        index = bisect_right(self._static_order_keys, order)
+        self._static_order_keys.insert(index, order)
+        self._static_order.insert(index, blit)
         #weakref.finalize(key, self._remove_static_blit, key)
         #weakref.finalize(key, print, "YOU KILLED", key)
         self._clear_this_frame.append(blit.rect)
@@ -469,8 +649,62 @@ class Scene:
         """
         if key in self._static_blits:
             x = self._static_blits.pop(key)
+            self._forget_static_blit(x)
             self._clear_this_frame.append(x.rect)
 
+    def _forget_static_blit(self, blit):
+        """
+        Removes the static blit from the spatial grid and the drawing order.
+        """
+        self._static_grid.remove(blit)
+        index = bisect_left(self._static_order_keys, _blit_order(blit))
+        while self._static_order[index] is not blit:
+            index += 1
+        del self._static_order_keys[index]
+        del self._static_order[index]
+
+    def _ordered_blits(self):
+        """
+        Yields every blit for this frame in drawing order. The static blits
+        are already kept sorted, so only the dynamic blits need sorting, and
+        then each one is slotted in between the static blits around it.
+        """
+        statics = iter(self._static_order)
+        static_keys = self._static_order_keys
+        position = 0
+        for blit in sorted(self._blits, key=_blit_order):
+            index = bisect_right(static_keys, _blit_order(blit))
+            yield from islice(statics, index - position)
+            yield blit
+            position = index
+        yield from statics
+
+    def _render_objects(self, interpolation=None):
+        """
+        Internal method that asks every live object in the scene to produce
+        its blit for this frame. Objects are walked directly rather than
+        going through the ``director.render`` event, which is left for any
+        user-level drawing handlers.
+
+        :param interpolation: How far (from 0 to 1) the game is between its
+                              last update and the next one, or ``None`` to
+                              draw every object exactly where it is. Objects
+                              that moved during the last update are drawn
+                              that fraction of the way along their motion.
+        :type interpolation: float
+        """
+        self._flush_redraws()
+        if interpolation is None or interpolation >= 1:
+            for object in self._renderables:
+                object._draw()
+            return
+        last_update = designer.GLOBAL_DIRECTOR._tick - 1
+        for object in self._renderables:
+            if object._pose_tick == last_update:
+                object._draw(interpolation)
+            else:
+                object._draw()
+
     def _draw(self):
         """
         Internal method that is called by the
@@ -480,26 +714,32 @@ class Scene:
 
         # This function sits in a potential hot loop
         # For that reason, some . lookups are optimized away
+        started = perf_counter()
         screen = self._surface
 
         # First we test if the background has been updated
         if self._background_version != self._background_image._version:
             self.background = self._background_image
 
+        # Every blit for this frame is collected into one sequence and handed
+        # to pygame in a single call, rather than one Python-level call each.
+        # Plain (source, dest) pairs are used unless a blit needs flags, so
+        # that fblits can be used where it is available.
+        sequence = []
+        flagged = False
+
         # Let's finish up any rendering from the previous frame
         # First, we put the background over all blits
-        x = self._background.get_rect()
+        background = self._background
+        x = background.get_rect()
         for i in self._clear_this_frame + self._soft_clear:
             i = x.clip(i)
-            b = self._background.subsurface(i)
-            screen.blit(b, i)
+            sequence.append((background.subsurface(i), i))
 
         # Now, we need to blit layers, while simultaneously re-blitting
         # any static blits which were obscured
         static_blits = len(self._static_blits)
         dynamic_blits = len(self._blits)
-        blits = list(self._static_blits.values()) + self._blits
-        blits.sort(key=lambda l: (l.layer, l.id))
 
         # Clear this is a list of things which need to be cleared
         # on this frame and marked dirty on the next
@@ -517,60 +757,87 @@ class Scene:
         screen_rect = screen.get_rect()
         drawn_static = 0
 
-        for blit in blits:
+        # Rather than testing every static blit against every cleared rect,
+        # we ask the spatial grid which static blits overlap the cleared
+        # regions. Redrawing a static blit dirties its own rect too, so any
+        # static blit found on top of it later is added to the same set.
+        hard_redraw = self._find_static_overlaps(clear_this)
+        soft_redraw = self._find_static_overlaps(soft_clear)
+
+        for blit in self._ordered_blits():
             blit_rect = blit.rect
-            blit_flags = blit.flags
-            # If a blit is entirely off screen, we can ignore it altogether
-            if not screen_rect.contains(blit_rect) and not screen_rect.colliderect(blit_rect):
-                continue
             # If this is a static blit...
             if blit.static:
-                skip_soft_clear = False
-                for rect in clear_this:
-                    if blit_rect.colliderect(rect):
-                        # One of the rects (needing to be cleared this frame and marked dirty on the next)
-                        # is colliding with the current static blit's rect
-                        # so we blit this static blit onto the screen and then add this static blit to the
-                        # _soft_clear for next time
-                        screen.blit(blit.surface, blit_rect, None, blit_flags)
-                        skip_soft_clear = True
-                        clear_this.append(blit_rect)
-                        self._soft_clear.append(blit_rect)
-                        drawn_static += 1
-                        break
-                if skip_soft_clear:
+                if blit not in hard_redraw and blit not in soft_redraw:
+                    continue
+                # If a blit is entirely off screen, we can ignore it altogether
+                if not screen_rect.colliderect(blit_rect):
                     continue
-                for rect in soft_clear:
-                    if blit_rect.colliderect(rect):
-                        screen.blit(blit.surface, blit_rect, None, blit_flags)
-                        soft_clear.append(blit.rect)
-                        drawn_static += 1
-                        break
+                if blit in hard_redraw:
+                    # One of the rects (needing to be cleared this frame and marked dirty on the next)
+                    # is colliding with the current static blit's rect
+                    # so we blit this static blit onto the screen and then add this static blit to the
+                    # _soft_clear for next time
+                    clear_this.append(blit_rect)
+                    self._soft_clear.append(blit_rect)
+                    hard_redraw.update(self._find_static_overlaps((blit_rect,)))
+                else:
+                    soft_redraw.update(self._find_static_overlaps((blit_rect,)))
+                drawn_static += 1
+            elif not screen_rect.colliderect(blit_rect):
+                continue
+            else:
+                # Objects hanging off the edge of the screen only dirty
+                # the part of the screen they actually cover
+                clear_next.append(blit_rect.clip(screen_rect))
+            if blit.flags:
+                flagged = True
+                sequence.append((blit.surface, blit_rect, None, blit.flags))
             else:
-                if screen_rect.contains(blit_rect):
-                    r = screen.blit(blit.surface, blit_rect, None, blit_flags)
-                    clear_next.append(r)
-                elif screen_rect.colliderect(blit_rect):
-                    # Todo: See if this is ever called. Shouldn't be.
-                    # Note: I believe it's called when an object is bigger than the screen
-                    x = blit.rect.clip(screen_rect)
-                    y = x.move(-blit_rect.left, -blit_rect.top)
-                    b = blit.surface.subsurface(y)
-                    r = screen.blit(blit.surface, blit_rect, None, blit_flags)
-                    clear_next.append(r)
-
-        if designer.GLOBAL_DIRECTOR.window_title is None:
-            pygame.display.set_caption("%d / %d static, %d dynamic. %d ups, %d fps" %
-                                      (drawn_static, static_blits,
-                                       dynamic_blits, self.clock.ups,
-                                       self.clock.fps))
-        # Do the display update
-        pygame.display.update(self._clear_next_frame + self._clear_this_frame)
+                sequence.append((blit.surface, blit_rect))
+
+        if flagged or not _HAS_FBLITS:
+            screen.blits(sequence, False)
+        else:
+            screen.fblits(sequence)
+
+        director = designer.GLOBAL_DIRECTOR
+        if director.show_timings or director.window_title is None:
+            statistics = ("%d / %d static, %d dynamic. %d ups, %d fps" %
+                          (drawn_static, static_blits, dynamic_blits,
+                           self.clock.ups, self.clock.fps))
+            if director.window_title is None:
+                pygame.display.set_caption(statistics)
+            if director.show_timings:
+                if self._timings_overlay is None:
+                    self._timings_overlay = _TimingsOverlay(self.clock.timings)
+                self._timings_overlay.extra = statistics
+                # Cleared next frame, like any other moving blit
+                clear_next.append(self._timings_overlay.draw(screen))
+        displaying = perf_counter()
+        self.clock.timings.record('draw', displaying - started)
+        # Do the display update, merging the dirty rects first
+        self._dirty_regions.update_display(self._clear_next_frame + self._clear_this_frame)
+        self.clock.timings.record('display', perf_counter() - displaying)
         # Get ready for the next call
         self._clear_this_frame = self._clear_next_frame
         self._clear_next_frame = []
         self._blits = []
 
+    def _find_static_overlaps(self, rects):
+        """
+        Returns the set of static blits whose rects collide with any of the
+        given rects, using the spatial grid to avoid checking every static
+        blit.
+        """
+        static_grid = self._static_grid
+        found = set()
+        for rect in rects:
+            for blit in static_grid.query(rect):
+                if blit not in found and blit.rect.colliderect(rect):
+                    found.add(blit)
+        return found
+
     def redraw(self):
         """
         Force the entire visible scene to be completely redrawn.
@@ -647,12 +914,52 @@ class Scene:
         box.finalize()
         return box
 
+    def _defer_redraw(self, object):
+        """
+        Marks the object's image as out of date. It will be redrawn once, at
+        the end of the update (or sooner, if something needs it first), no
+        matter how many of its properties changed in the meantime.
+        """
+        self._pending_redraws[object] = None
+
+    def _flush_redraws(self):
+        """
+        Redraws the image of every object that changed since the last flush.
+        Redrawing can change other objects (like a group's children), so this
+        keeps going until nothing is left.
+        """
+        while self._pending_redraws:
+            pending, self._pending_redraws = self._pending_redraws, {}
+            for object in pending:
+                object._flush_image()
+
     def _set_collision_box(self, entity, box):
         """
         Registers the given entity (a View or Sprite) with the given
         CollisionBox.
         """
         self._collision_boxes[entity] = box
+        self._collision_grid.insert(entity, box)
+
+    def _invalidate_collision_box(self, entity):
+        """
+        Marks the entity's collision box as out of date. It will be recomputed
+        the next time any collision is checked, so an object that changes many
+        times between checks only has its box rebuilt once.
+        """
+        self._stale_collision_boxes[entity] = None
+
+    def _refresh_collision_boxes(self):
+        """
+        Recomputes the collision box of every entity that changed since the
+        last collision check.
+        """
+        self._flush_redraws()
+        if not self._stale_collision_boxes:
+            return
+        stale, self._stale_collision_boxes = self._stale_collision_boxes, {}
+        for entity in stale:
+            entity._set_collision_box()
 
     def collide_objects(self, first, second):
         """
@@ -666,19 +973,23 @@ class Scene:
                       :class:`View <spyral.View>`
         :returns: A ``bool``
         """
+        self._refresh_collision_boxes()
         if first not in self._collision_boxes or second not in self._collision_boxes:
             return False
         first_box = self._collision_boxes[first]
         second_box = self._collision_boxes[second]
-        return first_box.collide_rect(second_box)
+        return (first_box.collide_rect(second_box) and
+                _refine_collision(first, first_box, second, second_box))
 
     def collide_object_at(self, first, second, x, y):
+        self._refresh_collision_boxes()
         if first not in self._collision_boxes or second not in self._collision_boxes:
             return False
         first_box = self._collision_boxes[first]
         moved_box = first_box.move(x, y)
         second_box = self._collision_boxes[second]
-        return moved_box.collide_rect(second_box)
+        return (moved_box.collide_rect(second_box) and
+                _refine_collision(first, moved_box, second, second_box))
 
     def collide_point(self, obj, *args):
         """
@@ -690,15 +1001,18 @@ class Scene:
         :type point: :class:`Vec2D <spyral.Vec2D>`
         :returns: A ``bool``
         """
-        point = args
+        self._refresh_collision_boxes()
         if len(args) == 2:
             point = (args[0], args[1])
-        elif len(args) != 1:
+        elif len(args) == 1:
+            point = args[0]
+        else:
             raise ValueError(f"Incorrect number of arguments to collide_point: Expected x and y, got {args}")
         if obj not in self._collision_boxes:
             return False
         object_box = self._collision_boxes[obj]
-        return object_box.collide_point(point)
+        return (object_box.collide_point(point) and
+                _refine_point(obj, object_box, point[0], point[1]))
 
     def collide_rect(self, obj, rect):
         """
@@ -710,7 +1024,262 @@ class Scene:
         :type rect: :class:`Rect <spyral.Rect>`
         :returns: A ``bool``
         """
+        self._refresh_collision_boxes()
         if obj not in self._collision_boxes:
             return False
         object_box = self._collision_boxes[obj]
-        return object_box.collide_rect(rect)
+        return object_box.collide_rect(rect) and _refine_collision(obj, object_box, None, rect)
+
+    def colliding_objects(self, obj):
+        """
+        Finds every other object that is colliding with the given object.
+        Only the objects near it are actually checked, so this stays fast
+        even when there are many objects in the scene.
+
+        :param obj: A object or view
+        :type obj: :class:`DesignerObject <designer.objects.designer_object.DesignerObject>`
+        :returns: A ``list`` of objects, in the order they were created.
+        """
+        self._refresh_collision_boxes()
+        if obj not in self._collision_boxes:
+            return []
+        object_box = self._collision_boxes[obj]
+        return self._sorted_objects(other for other in self._collision_grid.query(object_box)
+                                    if other is not obj and
+                                    _boxes_collide(object_box, self._collision_boxes[other]) and
+                                    _refine_collision(obj, object_box, other, self._collision_boxes[other]))
+
+    def objects_in_rect(self, rect):
+        """
+        Finds every object that is colliding with the rect.
+
+        :param rect: A rect
+        :type rect: :class:`Rect <designer.utilities.rect.Rect>`
+        :returns: A ``list`` of objects, in the order they were created.
+        """
+        self._refresh_collision_boxes()
+        return self._sorted_objects(other for other in self._collision_grid.query(rect)
+                                    if _boxes_collide(self._collision_boxes[other], rect) and
+                                    _refine_collision(other, self._collision_boxes[other], None, rect))
+
+    def objects_at_point(self, x, y):
+        """
+        Finds every object that is colliding with the point.
+
+        :param float x: The horizontal position of the point.
+        :param float y: The vertical position of the point.
+        :returns: A ``list`` of objects, in the order they were created.
+        """
+        self._refresh_collision_boxes()
+        point = (x, y)
+        return self._sorted_objects(other for other in self._collision_grid.query_point(x, y)
+                                    if self._collision_boxes[other].collide_point(point) and
+                                    _refine_point(other, self._collision_boxes[other], x, y))
+
+    def colliding_pairs(self, firsts, seconds):
+        """
+        Finds every pair of objects, one from each list, that are colliding.
+        An object is never paired with itself. Only nearby objects are
+        checked; if NumPy is installed, those are all checked at once.
+
+        :param firsts: The first list of objects
+        :type firsts: a list of :class:`DesignerObject <designer.objects.designer_object.DesignerObject>`
+        :param seconds: The second list of objects
+        :type seconds: a list of :class:`DesignerObject <designer.objects.designer_object.DesignerObject>`
+        :returns: A ``list`` of (first, second) tuples, ordered by their
+                  positions in the two lists.
+        """
+        self._refresh_collision_boxes()
+        firsts, seconds = list(firsts), list(seconds)
+        boxes = self._collision_boxes
+        pairs = _colliding_candidates([boxes.get(obj) for obj in firsts],
+                                      [boxes.get(obj) for obj in seconds],
+                                      self._nearby_pairs(firsts, seconds))
+        return [(firsts[first], seconds[second]) for first, second in pairs
+                if firsts[first] is not seconds[second] and
+                _refine_collision(firsts[first], boxes[firsts[first]], seconds[second], boxes[seconds[second]])]
+
+    def _nearby_pairs(self, firsts, seconds):
+        """
+        Internal method to find the indices of every pair of objects that
+        share a cell of the collision grid, and so might be colliding.
+        """
+        boxes = self._collision_boxes
+        positions = defaultdict(list)
+        for index, obj in enumerate(seconds):
+            if obj in boxes:
+                positions[obj].append(index)
+        pairs = []
+        for first, obj in enumerate(firsts):
+            if obj not in boxes:
+                continue
+            for other in self._collision_grid.query(boxes[obj]):
+                if other in positions:
+                    pairs.extend((first, second) for second in positions[other])
+        return pairs
+
+    def colliding_any(self, obj, objects):
+        """
+        Returns whether the object is colliding with any of the other objects
+        (besides itself).
+
+        :param obj: A DesignerObject
+        :type obj: :class:`DesignerObject <designer.objects.designer_object.DesignerObject>`
+        :param objects: The other objects
+        :type objects: a list of :class:`DesignerObject <designer.objects.designer_object.DesignerObject>`
+        :returns: A ``bool``
+        """
+        self._refresh_collision_boxes()
+        if obj not in self._collision_boxes:
+            return False
+        boxes = self._collision_boxes
+        box = boxes[obj]
+        nearby = self._collision_grid.query(box)
+        return any(other is not obj and other in nearby and _boxes_collide(box, boxes[other]) and
+                   _refine_collision(obj, box, other, boxes[other])
+                   for other in objects)
+
+    def _collision_subscriptions(self):
+        """
+        Internal method to find the collisions that handlers in this scene are
+        waiting for, as (namespace, first kind, second kind) tuples. The kinds
+        are looked up from the names in each ``collision.<first>.<second>``
+        namespace.
+        """
+        if self._collision_subscription_cache is None:
+            kinds = designer.GLOBAL_DIRECTOR._collision_kinds
+            subscriptions = []
+            for namespace in sorted(self._namespaces):
+                pieces = namespace.split('.')
+                if len(pieces) == 3 and pieces[0] == 'collision' and pieces[1] in kinds and pieces[2] in kinds:
+                    subscriptions.append((namespace, kinds[pieces[1]], kinds[pieces[2]]))
+            self._collision_subscription_cache = subscriptions
+        return [subscription for subscription in self._collision_subscription_cache
+                if self._prune_dead_handlers(subscription[0])]
+
+    def _prune_dead_handlers(self, namespace):
+        """
+        Internal method to drop the handlers in the namespace whose function
+        (or the object it belonged to) has been garbage collected. Once none
+        are left, the namespace's handlers are forgotten entirely, so nothing
+        is done for it until a new handler is registered.
+
+        :returns: Whether the namespace still has any handlers.
+        :rtype: bool
+        """
+        handlers = self._handlers.get(namespace)
+        if handlers is None:
+            return False
+        alive = [h for h in handlers
+                 if h[4] is True or not isinstance(h[0], _wref) or h[0]() is not None]
+        if len(alive) != len(handlers):
+            # Replaced rather than changed, like in _unregister_object_events
+            if alive:
+                self._handlers[namespace] = alive
+            else:
+                del self._handlers[namespace]
+        return bool(alive)
+
+    def _dispatch_collisions(self):
+        """
+        Internal method that checks, once per update, every collision that a
+        handler is waiting for, and handles a ``collision.<first>.<second>``
+        event for each colliding pair of objects. When both kinds are the same,
+        each pair is only sent once. The pairs are sent in the order their
+        objects were created, and objects destroyed by an earlier handler are
+        skipped.
+        """
+        subscriptions = self._collision_subscriptions()
+        if not subscriptions:
+            return
+        # The objects of each kind are only gathered (and put in the order
+        # they were created) once, however many subscriptions share them
+        members = {}
+        for _, first, second in subscriptions:
+            members.setdefault(first, [])
+            members.setdefault(second, [])
+        for obj in self._renderables:
+            for kind, objects in members.items():
+                if _is_kind(obj, kind):
+                    objects.append(obj)
+        for objects in members.values():
+            objects.sort(key=_creation_order)
+        for namespace, first, second in subscriptions:
+            for first_object, second_object in self.colliding_pairs(members[first], members[second]):
+                if first is second and first_object._id > second_object._id:
+                    continue
+                if not (first_object._active and second_object._active):
+                    continue
+                self._handle_event(namespace, Event(world=self._game_state,
+                                                    first=first_object, second=second_object))
+
+    def sweep_collision(self, obj, dx, dy, others=None):
+        """
+        Finds the first object that the given object would hit if it moved by
+        `dx` and `dy`, checking the whole path instead of just the end point.
+        This stops fast objects from skipping through thin ones. Only the
+        collision boxes are used, whatever the objects' collision modes.
+
+        :param obj: The object that is moving
+        :type obj: :class:`DesignerObject <designer.objects.designer_object.DesignerObject>`
+        :param float dx: How far the object moves horizontally.
+        :param float dy: How far the object moves vertically.
+        :param others: If given, only these objects are checked.
+        :type others: a list of :class:`DesignerObject <designer.objects.designer_object.DesignerObject>`
+        :returns: A ``tuple`` of the time of impact (from ``0`` at the start of the
+                  move to ``1`` at the end) and the object hit, or ``None`` if
+                  nothing is in the way.
+        """
+        self._refresh_collision_boxes()
+        if obj not in self._collision_boxes:
+            return None
+        boxes = self._collision_boxes
+        box = boxes[obj]
+        path = Rect(min(box._x, box._x + dx), min(box._y, box._y + dy),
+                    box._w + abs(dx) + 1, box._h + abs(dy) + 1)
+        candidates = self._collision_grid.query(path)
+        if others is not None:
+            candidates.intersection_update(others)
+        earliest = None
+        for other in self._sorted_objects(candidates):
+            if other is obj:
+                continue
+            time = self._sweep_time(box, dx, dy, boxes[other])
+            if time is not None and (earliest is None or time < earliest[0]):
+                earliest = (time, other)
+        return earliest
+
+    @staticmethod
+    def _sweep_time(box, dx, dy, other):
+        """
+        Internal method to find when the box, moving by `dx` and `dy`, first
+        overlaps the other box, using the slab method on each axis.
+
+        :returns: A ``float`` between ``0`` and ``1``, or ``None`` if they never
+                  overlap during the move.
+        """
+        entry, exit = float('-inf'), float('inf')
+        for start, size, delta, other_start, other_size in ((box._x, box._w, dx, other._x, other._w),
+                                                            (box._y, box._h, dy, other._y, other._h)):
+            if delta == 0:
+                if not (start < other_start + other_size and other_start < start + size):
+                    return None
+                continue
+            if delta > 0:
+                axis_entry = (other_start - (start + size)) / delta
+                axis_exit = (other_start + other_size - start) / delta
+            else:
+                axis_entry = (other_start + other_size - start) / delta
+                axis_exit = (other_start - (start + size)) / delta
+            entry, exit = max(entry, axis_entry), min(exit, axis_exit)
+        if entry < exit and entry <= 1 and exit > 0:
+            return max(entry, 0.0)
+        return None
+
+    @staticmethod
+    def _sorted_objects(objects):
+        """
+        Internal method to put objects in a stable order (the order they were
+        created), since the collision grid hands them back in no particular order.
+        """
+        return sorted(objects, key=lambda obj: getattr(obj, '_id', 0))
@@ -8,10 +8,11 @@ import io
 
 import designer
 from designer.mouse import get_mouse_position
-from designer.core.event import register, KNOWN_EVENTS
+from designer.core.event import register, KNOWN_EVENTS, _HandlerBinder
 from designer.core.director import Director
 from designer.core.internal_image import InternalImage
 from designer.utilities.vector import Vec2D
+from designer.utilities.rect import Rect
 from designer.utilities.argument_checks import make_suggestions
 from designer.system import running_on_skulpt
 from designer.utilities.weak_functions import weak_function
@@ -360,10 +361,13 @@ def when(event: Union[str, callable], *funcs):
         event = 'updating'
 
         def _dynamic_event(func):
+            binder = _HandlerBinder(func)
+
             def _inner_dynamic_event(event, world):
                 if event_function(world):
                     scene = designer.GLOBAL_DIRECTOR.current_scene
-                    scene._send_event_to_handler(event, 'updating', weak_function(func), None, None, None, None)
+                    scene._send_event_to_handler(event, 'updating', weak_function(func), None, None, None, None,
+                                                 binder)
 
             return _inner_dynamic_event
 
@@ -374,6 +378,8 @@ def when(event: Union[str, callable], *funcs):
         event, *targets = event.split(':')
         event = event.strip()
         targets = [t.strip() for t in targets]
+    if event == 'colliding':
+        return _when_colliding(targets, *funcs)
     if event not in KNOWN_EVENTS and not any(e.startswith(event) for e in KNOWN_EVENTS):
         suggestions = make_suggestions(event, KNOWN_EVENTS)
         if suggestions:
@@ -391,6 +397,26 @@ def when(event: Union[str, callable], *funcs):
         return decorated
 
 
+def _when_colliding(targets, first=None, second=None, *funcs):
+    """
+    Registers handlers for whenever an object of the `first` kind collides with one of the
+    `second` kind. Each kind is either a class (like ``Circle``) or a layer name. Collisions are
+    checked once per update, and each handler gets the world and the two colliding objects.
+    """
+    if first is None or second is None:
+        raise ValueError("The 'colliding' event needs two kinds of objects to watch, "
+                         "like: when('colliding', Bullet, Enemy, handle_hit)")
+    namespace = designer.GLOBAL_DIRECTOR._collision_namespace(first, second)
+    if funcs:
+        for func in funcs:
+            register(namespace, func, targets=targets)
+    else:
+        def decorated(function):
+            register(namespace, function, targets=targets)
+
+        return decorated
+
+
 def starting(*funcs):
     return when('starting', *funcs)
 
@@ -407,6 +433,36 @@ def clicking(*funcs):
     return when('clicking', *funcs)
 
 
+def after(seconds, func, *args):
+    """
+    Calls the function once, after the given number of seconds have passed
+    in the current scene. Any extra arguments are passed along to it. Time
+    does not pass for the timer while the game is paused.
+
+    :param seconds: How long to wait, in seconds
+    :type seconds: float
+    :param func: The function to call
+    :returns: A timer, which can be stopped early with its ``cancel()`` method
+    """
+    check_initialized()
+    return designer.GLOBAL_DIRECTOR.current_scene.clock.schedule(func, seconds, 1, args)
+
+
+def every(seconds, func, *args):
+    """
+    Calls the function over and over, each time the given number of seconds
+    has passed in the current scene. Any extra arguments are passed along to it.
+    Time does not pass for the timer while the game is paused.
+
+    :param seconds: How long to wait between calls, in seconds
+    :type seconds: float
+    :param func: The function to call
+    :returns: A timer, which can be stopped with its ``cancel()`` method
+    """
+    check_initialized()
+    return designer.GLOBAL_DIRECTOR.current_scene.clock.schedule(func, seconds, 0, args)
+
+
 # TODO: would_be_colliding function to test a hypothetical move
 
 def colliding(*args):
@@ -440,6 +496,46 @@ def would_collide(*args):
     return obj1.collide_other_at(obj2, new_x, new_y)
 
 
+def sweep_collision(obj, dx, dy, others=None):
+    """
+    Returns the first object that `obj` would hit while moving by `dx` and `dy`, as a tuple of
+    the time of impact (between 0 and 1) and the object hit, or None if nothing is in the way.
+    Unlike would_collide, this checks the whole path, so fast objects can't skip over thin ones.
+    """
+    check_initialized()
+    return obj._scene().sweep_collision(obj, dx, dy, others)
+
+
+def get_colliding_objects(obj):
+    """ Returns a list of all the other objects colliding with the given object. """
+    check_initialized()
+    return obj._scene().colliding_objects(obj)
+
+
+def get_objects_in_area(x, y, width, height):
+    """ Returns a list of all the objects colliding with the given rectangular area. """
+    check_initialized()
+    return designer.GLOBAL_DIRECTOR.current_scene.objects_in_rect(Rect(x, y, width, height))
+
+
+def get_objects_at(x, y):
+    """ Returns a list of all the objects underneath the given point. """
+    check_initialized()
+    return designer.GLOBAL_DIRECTOR.current_scene.objects_at_point(x, y)
+
+
+def colliding_pairs(first_objects, second_objects):
+    """ Returns a list of every (first, second) pair of objects, one from each list, that are colliding. """
+    check_initialized()
+    return designer.GLOBAL_DIRECTOR.current_scene.colliding_pairs(first_objects, second_objects)
+
+
+def colliding_any(obj, objects):
+    """ Returns whether the object is colliding with any of the other objects. """
+    check_initialized()
+    return designer.GLOBAL_DIRECTOR.current_scene.colliding_any(obj, objects)
+
+
 def destroy(*gobjects):
     check_initialized()
     for gobject in gobjects:
@@ -8,11 +8,13 @@ from designer.objects.designer_object import DesignerObject
 from designer.core.internal_image import InternalImage, DesignerSurface
 from designer.utilities.vector import Vec2D
 from designer.utilities.util import _anchor_offset
+from designer.utilities.transform_cache import _shape_surface
 
 
 class Arc(DesignerObject):
     DEFAULT_BORDER_WIDTH = 1
     FIELDS = (*DesignerObject.FIELDS, 'color', 'border')
+    __slots__ = ['_start_angle', '_stop_angle', '_color', '_border']
 
     def __init__(self, center, width, height, start_angle, stop_angle, anchor, color, border, **kwargs):
         """
@@ -72,9 +74,22 @@ class Arc(DesignerObject):
         if size[0] <= 0 or size[1] <= 0:
             target = InternalImage(size=(1, 1)).fill(color)
             self._transform_image = target._surf
+            self._transform_shared = False
             self._recalculate_offset()
             self._expire_static()
             return
+        # Arcs that look the same share one surface
+        key = ('arc', tuple(color), self._start_angle, self._stop_angle, size, tuple(self._size),
+               self._border, self._flip_x, self._flip_y, self._angle % 360)
+        surface, offset = _shape_surface(key, lambda: self._draw_arc(color, size))
+        if offset is not None:
+            self._transform_offset = offset
+        self._transform_image = surface
+        self._transform_shared = True
+        self._recalculate_offset()
+        self._expire_static()
+
+    def _draw_arc(self, color, size):
         new_image = InternalImage(size=size)
         new_image.draw_arc(color,
                            math.pi/180 * self._start_angle,
@@ -84,15 +99,14 @@ class Arc(DesignerObject):
         if self._flip_x or self._flip_y:
             new_image.flip(self._flip_x, self._flip_y)
         # Rotation
+        offset = None
         if self._angle != 0:
             angle = self._angle % 360
             old = Vec2D(new_image.rect.center)
             new_image.rotate(angle)
             new = new_image.rect.center
-            self._transform_offset = old - new
-        self._transform_image = new_image._surf
-        self._recalculate_offset()
-        self._expire_static()
+            offset = old - new
+        return new_image._surf, offset
 
     @property
     def start_angle(self):
@@ -101,7 +115,7 @@ class Arc(DesignerObject):
     @start_angle.setter
     def start_angle(self, value):
         self._start_angle = value
-        self._redraw_internal_image()
+        self._invalidate_image()
 
     @property
     def stop_angle(self):
@@ -110,7 +124,7 @@ class Arc(DesignerObject):
     @stop_angle.setter
     def stop_angle(self, value):
         self._stop_angle = value
-        self._redraw_internal_image()
+        self._invalidate_image()
 
     @property
     def color(self):
@@ -119,7 +133,7 @@ class Arc(DesignerObject):
     @color.setter
     def color(self, value):
         self._color = value
-        self._redraw_internal_image()
+        self._invalidate_image()
 
     @property
     def border(self):
@@ -128,7 +142,7 @@ class Arc(DesignerObject):
     @border.setter
     def border(self, value):
         self._border = value
-        self._redraw_internal_image()
+        self._invalidate_image()
 
 
 def arc(color, start_angle, stop_angle, width, height,
@@ -4,10 +4,12 @@ from designer.objects.designer_object import DesignerObject
 from designer.core.internal_image import InternalImage, DesignerSurface
 from designer.utilities import Vec2D
 from designer.utilities.util import _anchor_offset
+from designer.utilities.transform_cache import _shape_surface
 
 
 class Circle(DesignerObject):
     FIELDS = (*DesignerObject.FIELDS, 'radius', 'color', 'border')
+    __slots__ = ['_radius', '_color', '_border']
 
     def __init__(self, color, radius, x=None, y=None, border=None, **kwargs):
         """
@@ -60,20 +62,27 @@ class Circle(DesignerObject):
 
     def _redraw_internal_image(self):
         radius = self._radius * self._scale[0]
-        diameter = 2 * radius
         color = _process_color(self._color)
-        if int(radius) > 0:
-            new_image = InternalImage(size=(diameter, diameter))
-            new_image.draw_circle(color, (radius, radius),
-                                  radius, self._border or 0)
-            target = new_image
-        else:
+        if int(radius) <= 0:
             target = InternalImage(size=(1, 1))
             target.fill(color)
-        self._transform_image = target._surf
+            self._transform_image = target._surf
+            self._transform_shared = False
+        else:
+            # Circles that look the same share one surface
+            self._transform_image, _ = _shape_surface(('circle', tuple(color), radius, self._border or 0),
+                                                      lambda: (self._draw_circle(color, radius), None))
+            self._transform_shared = True
         self._recalculate_offset()
         self._expire_static()
 
+    def _draw_circle(self, color, radius):
+        diameter = 2 * radius
+        new_image = InternalImage(size=(diameter, diameter))
+        new_image.draw_circle(color, (radius, radius),
+                              radius, self._border or 0)
+        return new_image._surf
+
     @property
     def radius(self):
         return self._radius
@@ -81,7 +90,7 @@ class Circle(DesignerObject):
     @radius.setter
     def radius(self, value):
         self._radius = value
-        self._redraw_internal_image()
+        self._invalidate_image()
 
     @property
     def size(self):
@@ -93,7 +102,7 @@ class Circle(DesignerObject):
             self._radius = int(value)
         else:
             self._radius = value[0]
-        self._redraw_internal_image()
+        self._invalidate_image()
 
     @property
     def width(self):
@@ -102,7 +111,7 @@ class Circle(DesignerObject):
     @width.setter
     def width(self, value):
         self._radius = value*2
-        self._redraw_internal_image()
+        self._invalidate_image()
 
     @property
     def height(self):
@@ -111,7 +120,7 @@ class Circle(DesignerObject):
     @height.setter
     def height(self, value):
         self._radius = value*2
-        self._redraw_internal_image()
+        self._invalidate_image()
 
     @property
     def color(self):
@@ -120,7 +129,7 @@ class Circle(DesignerObject):
     @color.setter
     def color(self, value):
         self._color = value
-        self._redraw_internal_image()
+        self._invalidate_image()
 
     @property
     def border(self):
@@ -129,7 +138,7 @@ class Circle(DesignerObject):
     @border.setter
     def border(self, value):
         self._border = value
-        self._redraw_internal_image()
+        self._invalidate_image()
 
 
 circle = Circle
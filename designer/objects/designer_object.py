@@ -1,5 +1,7 @@
 import difflib
 
+import pygame
+
 import designer
 from typing import List, Optional, Dict
 
@@ -9,12 +11,14 @@ except ImportError:
     _wref = lambda x: x
 
 from designer.core.scene import Scene
-from designer.core.event import Event, register, unregister
+from designer.core.event import Event, register
 from designer.utilities.vector import Vec2D
 from designer.core.internal_image import InternalImage, DesignerSurface
 from designer.utilities.rect import Rect
 from designer.utilities.util import _anchor_offset, _Blit, _CollisionBox
 from designer.utilities.animation import Animation
+from designer.utilities.collision_shapes import _check_collision_mode
+from designer.utilities.transform_cache import _transform_image
 
 
 class DesignerObject:
@@ -31,10 +35,38 @@ class DesignerObject:
         "size", "scale", "scale_x", "scale_y",
         "anchor",
         "angle", "flip_x", "flip_y", "visible",
-        "parent", "mask",
+        "parent", "mask", "collision_mode", "rotation_steps",
         "alpha"
     )
     _ID = 0
+    # The state of every object is kept in slots rather than a dictionary, which
+    # makes objects smaller and faster to make. Subclasses declare their own;
+    # keeping __dict__ means any other attribute can still be set.
+    __slots__ = ['_id', '_age', '_static', '_make_static',
+                 '_pose_tick', '_previous_pos', '_previous_angle',
+                 '_layer', '_blend_flags', '_alpha', '_visible',
+                 '_pos', '_size', '_anchor', '_scale', '_angle', '_rotation_steps',
+                 '_flip_x', '_flip_y', '_active', '_crop', '_mask',
+                 '_collision_mode', '_pixel_mask_cache',
+                 '_offset', '_computed_layer',
+                 '_transform_image', '_transform_shared', '_transform_offset', '_image_dirty',
+                 '_animations', '_progress', '_parent', '_scene',
+                 '__dict__', '__weakref__']
+    _independent_fields = ('_pos', '_size', '_anchor', '_scale', '_angle', '_flip_x', '_flip_y')
+    #: The annotated fields of this class and its parents, which can be given
+    #: as keyword arguments when making an object
+    _ANNOTATED_FIELDS = ()
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Collects the annotated fields of a new subclass (like a student's own
+        kind of object), once, rather than every time an object is made.
+        """
+        super().__init_subclass__(**kwargs)
+        annotated = {}
+        for klass in cls.__mro__:
+            annotated.update(dict.fromkeys(getattr(klass, '__annotations__', {})))
+        cls._ANNOTATED_FIELDS = tuple(annotated)
 
     def __init__(self, parent=None, **kwargs):
         designer.check_initialized()
@@ -42,11 +74,9 @@ class DesignerObject:
         if parent is None:
             parent = designer.GLOBAL_DIRECTOR.current_scene
 
-        for obj in [self, *type(self).mro()]:
-            if hasattr(obj, '__annotations__'):
-                for key in obj.__annotations__:
-                    if key in kwargs:
-                        setattr(self, key, kwargs.get(key))
+        for key in self._ANNOTATED_FIELDS:
+            if key in kwargs:
+                setattr(self, key, kwargs[key])
 
         # Unique ID for this object
         self._id = DesignerObject._ID
@@ -57,9 +87,13 @@ class DesignerObject:
         #: Whether or not this DesignerObject will not need to be redrawn for a while
         self._static: bool = False
         self._make_static = False
+        #: The update when this object last moved or turned, and its position
+        #: and angle from before that update; ``None`` until it is first drawn
+        self._pose_tick: Optional[int] = None
+        self._previous_pos = None
+        self._previous_angle = None
 
         # Independent Fields
-        self._independent_fields = ('_pos', '_size', '_anchor', '_scale', '_angle', '_flip_x', '_flip_y')
         self._layer: Optional[str] = kwargs.get('layer', None)
         self._blend_flags = 0
         self._alpha = kwargs.get('alpha', 1.0)
@@ -73,19 +107,28 @@ class DesignerObject:
         else:
             self._scale = Vec2D(kwargs.get('scale_x', 1.0), kwargs.get('scale_y', 1.0))
         self._angle = kwargs.get('angle', 0)
+        self._rotation_steps = kwargs.get('rotation_steps', 0)
         self._flip_x = kwargs.get('flip_x', False)
         self._flip_y = kwargs.get('flip_y', False)
         self._active = kwargs.get('active', False)
         # TODO: Finish setting up cropping
         self._crop: Optional[Rect] = None
         self._mask: Optional[Rect] = None
+        self._collision_mode = _check_collision_mode(kwargs.get('collision_mode', 'rect'))
+        #: The last image a pixel mask was made for, and that mask
+        self._pixel_mask_cache = None
 
         # Dependent fields
         self._offset = Vec2D(0, 0)
         self._computed_layer = parent.scene._get_layer_position(parent, self._layer)
         #: The actual image after it has been scaled/cropped/rotated/etc.
         self._transform_image: Optional[DesignerSurface] = None
+        #: Whether the transformed image is shared with other objects (through
+        #: the transform cache), and so must be copied before it is changed
+        self._transform_shared = False
         self._transform_offset = Vec2D(0, 0)
+        #: Whether the transformed image is out of date, and waiting to be redrawn
+        self._image_dirty = False
 
         # Animation stuff
         self._animations: List[Animation] = []
@@ -99,8 +142,6 @@ class DesignerObject:
         if designer.GLOBAL_DIRECTOR.running:
             self._reactivate()
 
-        self.FIELDS = set(self.FIELDS)
-
     def __repr__(self):
         activated = "" if self._active else "INACTIVE "
         name = type(self).__name__
@@ -125,9 +166,26 @@ class DesignerObject:
 
     def __setitem__(self, key, value):
         """ Allow this object to be treated like a dictionary. """
-        self.FIELDS.add(key)
+        if key not in self.FIELDS:
+            # Only objects given new keys need their own list of fields
+            self.FIELDS = (*self.FIELDS, key)
         self.__setattr__(key, value)
 
+    def update(self, **properties):
+        """
+        Changes several properties of this object at once. The object's image
+        is only redrawn once for all of them, just like when the properties
+        are changed one at a time during an update.
+
+        >>> my_object.update(x=100, y=200, angle=45)
+
+        :returns: This object, so that it can be used in an expression
+        """
+        for key, value in properties.items():
+            self.check_key(key)
+            self[key] = value
+        return self
+
     def _set_static(self):
         """
         Forces this class to be static, indicating that it will not be redrawn
@@ -143,8 +201,8 @@ class DesignerObject:
     def _expire_static(self):
         """
         Force this class to no longer be static; it will be redrawn for a few
-        frames, until it has sufficiently aged. This also triggers the collision
-        box to be recomputed.
+        frames, until it has sufficiently aged. This also marks the collision
+        box to be recomputed before the next collision check.
 
         :rtype: bool
         :returns: whether it was successful
@@ -155,42 +213,68 @@ class DesignerObject:
             self._scene()._remove_static_blit(self)
         self._static = False
         self._age = 0
-        self._set_collision_box()
+        self._scene()._invalidate_collision_box(self)
         return True
 
+    def _remember_pose(self):
+        """
+        Records where this object was before the current update, the first
+        time it moves or turns during that update, so that it can be drawn
+        in between the two poses.
+        """
+        if self._pose_tick is None:
+            return
+        tick = designer.GLOBAL_DIRECTOR._tick
+        if self._pose_tick != tick:
+            self._pose_tick = tick
+            self._previous_pos = self._pos
+            self._previous_angle = self._angle
+
     def _make_blank_surface(self):
         self._transform_image = DesignerSurface((1, 1))
+        self._transform_shared = False
         self._recalculate_offset()
         self._expire_static()
 
     def _default_redraw_transforms(self, target):
-        if self._flip_x or self._flip_y:
-            target.flip(self._flip_x, self._flip_y)
-        # Scale
-        if self._scale != (1.0, 1.0):
-            new_size = self._scale * target.size
-            new_size = (int(new_size[0]), int(new_size[1]))
-            if 0 in new_size:
-                self._transform_image = DesignerSurface((1, 1))
-                self._recalculate_offset()
-                self._expire_static()
-                return
-            target.scale(new_size)
-        # Rotate
-        if self._angle != 0:
-            angle = self._angle % 360
-            # old = Vec2D(target.rect.center)
-            target.rotate(angle)
-            # new = target.rect.center
-            # self._transform_offset = old - new
+        """
+        Flips, scales, and rotates the target image (in that order) to make
+        this object's transformed image. The target itself is left unchanged,
+        and the result may be shared with other objects through the transform
+        cache.
+        """
+        transformed = _transform_image(target, self._flip_x, self._flip_y, self._scale, self._angle,
+                                       self._rotation_steps)
+        if transformed is None:
+            return self._make_blank_surface()
         # Finish updates
-        self._transform_image = target._surf
+        self._transform_image, _ = transformed
+        self._transform_shared = True
         self._recalculate_offset()
         self._expire_static()
 
     def _redraw_internal_image(self):
         pass
 
+    def _invalidate_image(self):
+        """
+        Marks this object's transformed image as out of date. Rather than
+        redrawing right away, the scene redraws it once before it is next
+        drawn or checked for collisions, so changing several properties in
+        the same update only pays for one redraw.
+        """
+        if not self._image_dirty:
+            self._image_dirty = True
+            self._scene()._defer_redraw(self)
+
+    def _flush_image(self):
+        """
+        Redraws this object's transformed image, if it is out of date.
+        """
+        if self._image_dirty:
+            self._image_dirty = False
+            self._redraw_internal_image()
+
     def _recalculate_offset(self):
         """
         Recalculates this designer object's offset based on its position, transform
@@ -212,6 +296,7 @@ class DesignerObject:
 
         >>> my_object.rect = designer.utilities.rect.Rect(10, 10, 64, 64)
         """
+        self._flush_image()
         return Rect(self._pos, self._size)
 
     @rect.setter
@@ -240,6 +325,7 @@ class DesignerObject:
     def pos(self, value):
         if value == self._pos:
             return
+        self._remember_pose()
         self._pos = Vec2D(value)
         self._expire_static()
 
@@ -304,6 +390,7 @@ class DesignerObject:
         """
         The width of the object after all transforms. Number.
         """
+        self._flush_image()
         return self._size[0]
 
     @width.setter
@@ -315,6 +402,7 @@ class DesignerObject:
         """
         The height of the image after all transforms. Number.
         """
+        self._flush_image()
         return self._size[1]
 
     @height.setter
@@ -326,13 +414,13 @@ class DesignerObject:
         """
         The size of the image after all transforms (:class:`Vec2D <designer.utilities.vector.Vec2D>`).
         """
+        self._flush_image()
         return self._size
 
     @size.setter
     def size(self, value):
         self._size = Vec2D(value)
-        self._redraw_internal_image()
-        self._expire_static()
+        self._invalidate_image()
 
     @property
     def scale(self):
@@ -351,8 +439,7 @@ class DesignerObject:
         if self._scale == value:
             return
         self._scale = Vec2D(value)
-        self._redraw_internal_image()
-        self._expire_static()
+        self._invalidate_image()
 
     @property
     def scale_x(self):
@@ -389,8 +476,31 @@ class DesignerObject:
     def angle(self, value):
         if self._angle == value:
             return
+        self._remember_pose()
         self._angle = value
-        self._redraw_internal_image()
+        self._invalidate_image()
+
+    @property
+    def rotation_steps(self):
+        """
+        For objects that are always turning: how many evenly spaced angles to
+        pre-render the object's image at, such as 64 or 128. The angle is then
+        drawn at the nearest of these, taken from a shared sheet that is
+        rendered in the background, instead of rotating the image every time.
+        At 0 (the default), the image is rotated to exactly the right angle.
+        Rectangles, circles, and emojis are not affected.
+        """
+        return self._rotation_steps
+
+    @rotation_steps.setter
+    def rotation_steps(self, value):
+        value = int(value)
+        if value < 0:
+            raise ValueError(f"The rotation_steps must be 0 or more, not {value!r}.")
+        if self._rotation_steps == value:
+            return
+        self._rotation_steps = value
+        self._invalidate_image()
 
     @property
     def flip_x(self):
@@ -405,7 +515,7 @@ class DesignerObject:
         if self._flip_x == value:
             return
         self._flip_x = value
-        self._redraw_internal_image()
+        self._invalidate_image()
 
     @property
     def flip_y(self):
@@ -420,7 +530,7 @@ class DesignerObject:
         if self._flip_y == value:
             return
         self._flip_y = value
-        self._redraw_internal_image()
+        self._invalidate_image()
 
     @property
     def alpha(self):
@@ -491,14 +601,47 @@ class DesignerObject:
     @mask.setter
     def mask(self, value):
         self._mask = value
-        self._set_collision_box()
+        self._scene()._invalidate_collision_box(self)
+
+    @property
+    def collision_mode(self):
+        """
+        How much of this object counts when checking for collisions: ``'rect'`` (the default)
+        uses the object's whole rectangle, ``'circle'`` uses the biggest circle that fits in
+        that rectangle, and ``'mask'`` uses only the visible pixels of the object. The more
+        precise modes are slower, but they are only checked once the rectangles already overlap.
+        """
+        return self._collision_mode
+
+    @collision_mode.setter
+    def collision_mode(self, value):
+        self._collision_mode = _check_collision_mode(value)
 
-    def _draw(self):
+    def _pixel_mask(self):
+        """
+        Internal method to get a :class:`pygame.Mask` of this object's visible
+        pixels. The mask is only remade when the object's image is redrawn.
+        """
+        self._flush_image()
+        surface = self._transform_image
+        if self._pixel_mask_cache is None or self._pixel_mask_cache[0] is not surface:
+            self._pixel_mask_cache = (surface, pygame.mask.from_surface(surface))
+        return self._pixel_mask_cache[1]
+
+    def _draw(self, interpolation=None):
         """
         Internal method for generating this object's blit, unless it is
         invisible or currently static. If it has aged sufficiently or is being
         forced, it will become static; otherwise, it ages one step.
+
+        :param interpolation: If given, how far (from 0 to 1) to draw this
+                              object between its pose before the last update
+                              and its current pose. An object that is still
+                              in between poses never becomes static.
+        :type interpolation: float
         """
+        if self._pose_tick is None:
+            self._pose_tick = -1
         if not self.visible:
             return
         if self._transform_image is None:
@@ -507,14 +650,23 @@ class DesignerObject:
             return
 
         # TODO: Make sure this is sufficient
-        self._transform_image.set_alpha(int(self._alpha * 255))
-
-        area = Rect(self._transform_image.get_rect())
-        b = _Blit(self._transform_image, self._pos - self._offset,
+        if self._transform_shared and self._alpha != 1:
+            # Other objects may be drawing the same surface, so fade a copy
+            self._transform_image = self._transform_image.copy()
+            self._transform_shared = False
+        if not self._transform_shared:
+            self._transform_image.set_alpha(int(self._alpha * 255))
+
+        surface, position = self._transform_image, self._pos - self._offset
+        if interpolation is not None:
+            surface, position = self._interpolate_blit(surface, position, interpolation)
+
+        area = Rect(surface.get_rect())
+        b = _Blit(surface, position,
                   area, self._computed_layer, self._blend_flags, False,
                   self._id)
 
-        if self._make_static or self._age > 4:
+        if interpolation is None and (self._make_static or self._age > 4):
             b.static = True
             self._make_static = False
             self._static = True
@@ -523,10 +675,31 @@ class DesignerObject:
         self._parent()._blit(b)
         self._age += 1
 
+    def _interpolate_blit(self, surface, position, interpolation):
+        """
+        Moves (and turns) this object's blit back towards its pose from
+        before the last update, leaving it the given fraction of the way
+        along. Turning keeps the center of the image in place, just like
+        setting the angle does.
+
+        :returns: A `tuple` of the surface to blit and where to blit it.
+        """
+        pos = Vec2D(self._pos)
+        position = position - (pos - self._previous_pos) * (1 - interpolation)
+        # Take the short way around, rather than spinning through 360 degrees
+        turn = (self._angle - self._previous_angle + 180) % 360 - 180
+        if turn:
+            rotated = pygame.transform.rotate(surface, -turn * (1 - interpolation))
+            rotated.set_alpha(surface.get_alpha())
+            position = position + (Vec2D(surface.get_size()) - rotated.get_size()) * 0.5
+            surface = rotated
+        return surface, position
+
     def _set_collision_box(self):
         """
         Updates this object's collision box.
         """
+        self._flush_image()
         if self._transform_image is None:
             return
         if self._mask is None:
@@ -549,7 +722,6 @@ class DesignerObject:
         self._scene()._unregister_object(self)
         self._parent()._remove_child(self)
         designer.GLOBAL_DIRECTOR._untrack_object(self)
-        unregister('director.render', self._draw)
 
     def _reactivate(self):
         """
@@ -564,7 +736,7 @@ class DesignerObject:
         self._scene()._register_object(self)
         self._age = 0
         self._static = False
-        self._scene().register('director.render', self._draw)
+        self._pose_tick = None
 
     # Animation Methods
 
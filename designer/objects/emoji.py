@@ -36,6 +36,7 @@ def lookup_unicode(name):
 
 class Emoji(DesignerObject):
     FIELDS = (*DesignerObject.FIELDS, 'name')
+    __slots__ = ['_name', '_svg', '_internal_image', '_internal_image_version']
     DEFAULT_EMOJI_SIZE = 36
     _EMOJI_CACHE = {}
 
@@ -206,9 +207,7 @@ class Emoji(DesignerObject):
             return
         self._name = value
         self._load_image()
-        self._redraw_internal_image()
-        self._recalculate_offset()
-        self._expire_static()
+        self._invalidate_image()
 
 
 emoji = Emoji
@@ -1,14 +1,14 @@
 from typing import Optional
 
-import pygame
 import math
 
 from designer.colors import _process_color
 from designer.helpers import get_width, get_height
 from designer.objects.designer_object import DesignerObject
-from designer.core.internal_image import InternalImage, DesignerSurface
+from designer.core.internal_image import InternalImage
 from designer.utilities import Vec2D, Rect
 from designer.utilities.util import _anchor_offset
+from designer.utilities.transform_cache import _transform_image
 from designer.objects.image import Image
 
 
@@ -19,6 +19,7 @@ class DesignerGroup(DesignerObject):
     '''
 
     FIELDS = (*DesignerObject.FIELDS, )
+    __slots__ = ['_internal_image', '_internal_image_version']
 
     def __init__(self, objects):
         """
@@ -29,6 +30,8 @@ class DesignerGroup(DesignerObject):
         """
         super().__init__()
 
+        for object in objects:
+            object._flush_image()
         boxes = [
             Rect(object._pos - object._offset, object._transform_image.get_size())
             for object in objects
@@ -77,27 +80,13 @@ class DesignerGroup(DesignerObject):
         """
         if self._internal_image is None:
             return
-        source = self._internal_image._surf
-        # Flip
-        if self._flip_x or self._flip_y:
-            source = pygame.transform.flip(source, self._flip_x, self._flip_y)
-        # Scale
-        if self._scale != (1.0, 1.0):
-            new_size = self._scale * self._internal_image.size
-            new_size = (int(new_size[0]), int(new_size[1]))
-            if 0 in new_size:
-                return self._make_blank_surface()
-            new_surf = DesignerSurface(new_size)
-            source = pygame.transform.smoothscale(source, new_size, new_surf)
-        # Rotate
-        if self._angle != 0:
-            angle = self._angle % 360
-            old = Vec2D(source.get_rect().center)
-            source = pygame.transform.rotate(source, angle).convert_alpha()
-            new = source.get_rect().center
-            self._transform_offset = old - new
+        transformed = _transform_image(self._internal_image, self._flip_x, self._flip_y,
+                                       self._scale, self._angle, self._rotation_steps)
+        if transformed is None:
+            return self._make_blank_surface()
         # Finish updates
-        self._transform_image = source
+        self._transform_image, self._transform_offset = transformed
+        self._transform_shared = True
         self._recalculate_offset()
         self._expire_static()
 
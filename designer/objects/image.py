@@ -9,9 +9,10 @@ import io
 
 from designer.helpers import get_width, get_height
 from designer.objects.designer_object import DesignerObject
-from designer.core.internal_image import InternalImage, DesignerSurface
+from designer.core.internal_image import InternalImage
 from designer.utilities import Vec2D
 from designer.utilities.util import _anchor_offset
+from designer.utilities.transform_cache import _transform_image
 from designer.utilities.gif_image import GifImage
 from designer.objects.pixels import PixelsList
 
@@ -34,6 +35,7 @@ except:
 class Image(DesignerObject):
     _USER_AGENT = "Designer Game Library for Python"
     FIELDS = (*DesignerObject.FIELDS, 'filename', 'image')
+    __slots__ = ['_internal_image', '_internal_image_version', '_raw', '_filename']
     _IMAGE_CACHE = {}
     _GIF_CACHE = {}
 
@@ -91,7 +93,9 @@ class Image(DesignerObject):
             # TODO: Return a copy instead?
             return self.animate(self._GIF_CACHE[self._filename])
         if self._filename in self._IMAGE_CACHE:
+            # The copy keeps the same contents key, so transforms are shared
             self._internal_image = self._IMAGE_CACHE[self._filename].copy()
+            return
         try:
             path_strs = self._filename.split('/')
             fixed_paths = os.path.join(*path_strs)
@@ -103,7 +107,7 @@ class Image(DesignerObject):
                         self._GIF_CACHE[fixed_paths] = gif
                 else:
                     self._internal_image = InternalImage(fixed_paths)
-                    self._IMAGE_CACHE[fixed_paths] = self._internal_image
+                    self._IMAGE_CACHE[fixed_paths] = self._internal_image.copy()
             else:
                 raise FileNotFoundError(fixed_paths)
         except FileNotFoundError as err:
@@ -118,7 +122,7 @@ class Image(DesignerObject):
                         self._GIF_CACHE[self._filename] = gif
                     else:
                         self._internal_image = InternalImage(filename=self._filename, fileobj=image_file)
-                        self._IMAGE_CACHE[self._filename] = self._internal_image
+                        self._IMAGE_CACHE[self._filename] = self._internal_image.copy()
             except:
                 if self._filename.startswith('https://') or self._filename.startswith('http://'):
                     raise ValueError(f"Unexpected error while loading url: {self._filename!r}")
@@ -164,29 +168,13 @@ class Image(DesignerObject):
         """
         if self._internal_image is None:
             return
-        source = self._internal_image._surf
-        # Flip
-        if self._flip_x or self._flip_y:
-            source = pygame.transform.flip(source, self._flip_x, self._flip_y)
-        # Scale
-        if self._scale != (1.0, 1.0):
-            new_size = self._scale * self._internal_image.size
-            new_size = (int(new_size[0]), int(new_size[1]))
-            if 0 in new_size:
-                return self._make_blank_surface()
-            new_surf = DesignerSurface(new_size)
-            source = pygame.transform.smoothscale(source, new_size, new_surf)
-        # Rotate
-        if self._angle != 0:
-            angle = self._angle % 360
-            old = Vec2D(source.get_rect().center)
-            source = pygame.transform.rotate(source, angle).convert_alpha()
-            new = source.get_rect().center
-            self._transform_offset = old - new
-        else:
-            self._transform_offset = Vec2D(0, 0)
+        transformed = _transform_image(self._internal_image, self._flip_x, self._flip_y,
+                                       self._scale, self._angle, self._rotation_steps)
+        if transformed is None:
+            return self._make_blank_surface()
         # Finish updates
-        self._transform_image = source
+        self._transform_image, self._transform_offset = transformed
+        self._transform_shared = True
         self._recalculate_offset()
         self._expire_static()
 
@@ -200,9 +188,7 @@ class Image(DesignerObject):
             return
         self._filename = value
         self._load_image()
-        self._redraw_internal_image()
-        self._recalculate_offset()
-        self._expire_static()
+        self._invalidate_image()
 
     @property
     def image(self):
@@ -211,11 +197,10 @@ class Image(DesignerObject):
     @image.setter
     def image(self, value):
         if isinstance(value, DesignerObject):
-            self._internal_image = value._transform_image.copy()
+            value._flush_image()
+            self._internal_image = InternalImage.from_surface(value._transform_image)
             self._filename = None
-            self._redraw_internal_image()
-            self._recalculate_offset()
-            self._expire_static()
+            self._invalidate_image()
             return
         if isinstance(value, pygame.Surface):
             value = InternalImage.from_surface(value)
@@ -227,9 +212,7 @@ class Image(DesignerObject):
             return
         self._internal_image = value
         self._filename = value._name
-        self._redraw_internal_image()
-        self._recalculate_offset()
-        self._expire_static()
+        self._invalidate_image()
 
 
 image = Image
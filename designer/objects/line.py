@@ -14,6 +14,7 @@ class Line(DesignerObject):
     FIELDS = (*DesignerObject.FIELDS,
               'start_x', 'start_y', 'end_x', 'end_y',
               'start', 'end', 'thickness', 'color')
+    __slots__ = ['_color', '_thickness', '_start', '_end']
 
 
     def __init__(self, start, end, thickness, color):
@@ -105,7 +106,7 @@ class Line(DesignerObject):
     def start_x(self, value):
         self._start = (self._start[0], value)
         self._calculate_positions(self._start, self._end, self._thickness)
-        self._redraw_internal_image()
+        self._invalidate_image()
 
     @property
     def start_y(self):
@@ -115,7 +116,7 @@ class Line(DesignerObject):
     def start_y(self, value):
         self._start = (value, self._start[1])
         self._calculate_positions(self._start, self._end, self._thickness)
-        self._redraw_internal_image()
+        self._invalidate_image()
 
     @property
     def end_x(self):
@@ -125,7 +126,7 @@ class Line(DesignerObject):
     def end_x(self, value):
         self._end = (self._end[0], value)
         self._calculate_positions(self._start, self._end, self._thickness)
-        self._redraw_internal_image()
+        self._invalidate_image()
 
     @property
     def end_y(self):
@@ -135,7 +136,7 @@ class Line(DesignerObject):
     def end_y(self, value):
         self._end = (value, self._end[1])
         self._calculate_positions(self._start, self._end, self._thickness)
-        self._redraw_internal_image()
+        self._invalidate_image()
 
     @property
     def color(self):
@@ -144,7 +145,7 @@ class Line(DesignerObject):
     @color.setter
     def color(self, value):
         self._color = value
-        self._redraw_internal_image()
+        self._invalidate_image()
 
     @property
     def thickness(self):
@@ -153,7 +154,7 @@ class Line(DesignerObject):
     @thickness.setter
     def thickness(self, value):
         self._thickness = value
-        self._redraw_internal_image()
+        self._invalidate_image()
 
 def line(color, start_x, start_y, end_x=None, end_y=None, thickness=1):
     '''
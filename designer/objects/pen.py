@@ -19,6 +19,8 @@ class Pen(DesignerObject):
     TODO: Finish this with the idea of iteratively "painting" on a canvas.
 
     """
+    __slots__ = ['_color', '_thickness', '_inking', '_speed', '_pen_pos',
+                 '_visited_points', '_bounds', '_current_animation', '_queued_animations']
 
     def __init__(self, center, thickness, color, speed):
         super().__init__()
@@ -73,8 +75,7 @@ class Pen(DesignerObject):
         self._bounds = self._get_bounds()
         self._pos = self._bounds.topleft
         self._size = self._bounds.size
-        self._redraw_internal_image()
-        self._expire_static()
+        self._invalidate_image()
 
     def move_to(self, x, y, speed=None):
         if speed is None:
@@ -86,7 +87,7 @@ class Pen(DesignerObject):
         self._visited_points.append(Vec2D(self._pen_pos))
         self._bounds = self._get_bounds()
         self._size = self._bounds.size
-        self._redraw_internal_image()
+        self._invalidate_image()
 
     def _finish_point(self):
         self._current_animation = None
@@ -20,6 +20,8 @@ class PixelsGrid:
 
 
 def get_pixels2d(designer_object):
+    if designer_object:
+        designer_object._flush_image()
     if not designer_object or not designer_object._internal_image._surf:
         return []
     surface = designer_object._internal_image._surf
@@ -30,6 +32,8 @@ def get_pixels2d(designer_object):
 
 
 def get_pixels(designer_object):
+    if designer_object:
+        designer_object._flush_image()
     if not designer_object or not designer_object._transform_image:
         return []
     surface = designer_object._transform_image
@@ -4,10 +4,12 @@ from designer.objects.designer_object import DesignerObject
 from designer.core.internal_image import InternalImage
 from designer.utilities.vector import Vec2D
 from designer.utilities.util import _anchor_offset
+from designer.utilities.transform_cache import _shape_surface
 
 
 class Rectangle(DesignerObject):
     FIELDS = (*DesignerObject.FIELDS, 'color', 'border')
+    __slots__ = ['_color', '_border']
 
     def __init__(self, color, width, height=None, x=None, y=None, border=None, **kwargs):
         """
@@ -71,20 +73,32 @@ class Rectangle(DesignerObject):
         if size[0] <= 0 or size[1] <= 0:
             target = InternalImage(size=(1, 1)).fill(color)
             self._transform_image = target._surf
+            self._transform_shared = False
             self._recalculate_offset()
             self._expire_static()
             return
+        # Rectangles that look the same share one surface
+        angle = self._angle % 360
+        surface, offset = _shape_surface(('rectangle', tuple(color), size, self._border or 0, angle),
+                                         lambda: self._draw_rectangle(color, size, angle))
+        if offset is not None:
+            self._transform_offset = offset
+        self._transform_image = surface
+        self._transform_shared = True
+        self._recalculate_offset()
+        self._expire_static()
+
+    def _draw_rectangle(self, color, size, angle):
         new_image = InternalImage(size=size)
         new_image.draw_rect(color, (0, 0), size, self._border or 0)
         # Rotation
-        if self._angle != 0:
+        offset = None
+        if angle != 0:
             old = Vec2D(new_image.rect.center)
-            new_image.rotate(self._angle % 360)
+            new_image.rotate(angle)
             new = new_image.rect.center
-            self._transform_offset = old - new
-        self._transform_image = new_image._surf
-        self._recalculate_offset()
-        self._expire_static()
+            offset = old - new
+        return new_image._surf, offset
 
     @property
     def color(self):
@@ -93,7 +107,7 @@ class Rectangle(DesignerObject):
     @color.setter
     def color(self, value):
         self._color = value
-        self._redraw_internal_image()
+        self._invalidate_image()
 
     @property
     def border(self):
@@ -102,7 +116,7 @@ class Rectangle(DesignerObject):
     @border.setter
     def border(self, value):
         self._border = value
-        self._redraw_internal_image()
+        self._invalidate_image()
 
 
 rectangle = Rectangle
@@ -13,6 +13,7 @@ from designer.utilities.rect import Rect
 class Shape(DesignerObject):
     DEFAULT_BORDER_WIDTH = 1
     FIELDS = (*DesignerObject.FIELDS, 'points', 'color', 'border')
+    __slots__ = ['_points', '_bounds', '_color', '_border']
 
     def __init__(self, center, points, anchor, color, border, absolute):
 
@@ -73,7 +74,7 @@ class Shape(DesignerObject):
     @color.setter
     def color(self, value):
         self._color = value
-        self._redraw_internal_image()
+        self._invalidate_image()
 
     @property
     def border(self):
@@ -83,7 +84,7 @@ class Shape(DesignerObject):
     def border(self, value):
         self._border = value
         self._size = self._get_bounds()
-        self._redraw_internal_image()
+        self._invalidate_image()
 
     @property
     def points(self):
@@ -97,7 +98,7 @@ class Shape(DesignerObject):
             raise ValueError("The points of a shape must be a list of at least 3 points")
         self._points = value
         self._size = self._get_bounds()
-        self._redraw_internal_image()
+        self._invalidate_image()
 
 
 def shape(color, *points, x=None, y=None, anchor='center', border=None, filled=True, absolute=False):
@@ -14,6 +14,7 @@ class Text(DesignerObject):
     DEFAULT_FONT_NAME = 'Arial'
     FONTS = {}
     FIELDS = (*DesignerObject.FIELDS, 'text', 'color', 'font', 'text_size')
+    __slots__ = ['_text', '_text_size', '_color', '_font_name', '_font_path', '_font', '_rendered']
 
     def __init__(self, center, anchor, text_string, text_size, color, font, font_path=None, **kwargs):
         """
@@ -45,6 +46,8 @@ class Text(DesignerObject):
         self._color = color
         self._font_name = font
         self._font_path = font_path
+        #: The text, font, and color last rendered, and the image of it
+        self._rendered = None
         self._update_font()
 
         # Draw the actual circle image
@@ -63,10 +66,16 @@ class Text(DesignerObject):
         self._offset = Vec2D(offset) - self._transform_offset
 
     def _redraw_internal_image(self):
-        text_surface = self._font.render(str(self.text), True, _process_color(self.color))
-        target = InternalImage(size=text_surface.get_size())
-        target._surf.blit(text_surface, (0, 0))
-        self._default_redraw_transforms(target)
+        # The rendered text is kept until the text itself changes, so that
+        # turning or scaling it can reuse earlier transforms
+        color = _process_color(self.color)
+        key = (str(self.text), self._font, tuple(color))
+        if self._rendered is None or self._rendered[0] != key:
+            text_surface = self._font.render(key[0], True, color)
+            target = InternalImage(size=text_surface.get_size())
+            target._surf.blit(text_surface, (0, 0))
+            self._rendered = (key, target)
+        self._default_redraw_transforms(self._rendered[1])
 
     @classmethod
     def _get_font(cls, font, text_size):
@@ -104,7 +113,7 @@ class Text(DesignerObject):
     def text_size(self, value):
         self._text_size = value
         self._update_font()
-        self._redraw_internal_image()
+        self._invalidate_image()
 
     @property
     def color(self):
@@ -113,7 +122,7 @@ class Text(DesignerObject):
     @color.setter
     def color(self, value):
         self._color = value
-        self._redraw_internal_image()
+        self._invalidate_image()
 
     @property
     def font(self):
@@ -123,7 +132,7 @@ class Text(DesignerObject):
     def font(self, value):
         self._font_name = value
         self._update_font()
-        self._redraw_internal_image()
+        self._invalidate_image()
 
     @property
     def text(self):
@@ -133,7 +142,7 @@ class Text(DesignerObject):
     def text(self, value):
         self._text = value
         self._update_size()
-        self._redraw_internal_image()
+        self._invalidate_image()
 
 
 def text(color, text, text_size=Text.DEFAULT_FONT_SIZE,
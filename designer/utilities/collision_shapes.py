@@ -0,0 +1,127 @@
+"""
+Refines collisions for objects that don't want to collide as plain rectangles.
+Every object has a collision mode:
+
+* ``'rect'``: the whole collision box is solid (the default).
+* ``'circle'``: only the largest circle that fits in the collision box is solid.
+* ``'mask'``: only the visible (non-transparent) pixels of the object are solid.
+
+These checks are only made once the collision boxes are already known to
+overlap, so the cheap rectangle test always runs first.
+"""
+from math import hypot
+
+import pygame
+
+from designer.utilities.memoize import SmartMemoize
+from designer.utilities.argument_checks import make_suggestions
+
+#: The allowed values for an object's collision mode.
+COLLISION_MODES = ('rect', 'circle', 'mask')
+
+
+def _check_collision_mode(mode):
+    """
+    Returns the collision mode unchanged, after making sure it is one of the
+    :data:`COLLISION_MODES`.
+    """
+    if mode not in COLLISION_MODES:
+        suggestions = make_suggestions(str(mode), COLLISION_MODES)
+        hint = f" Perhaps you meant one of: {suggestions}" if suggestions else ""
+        raise ValueError(f"Unknown collision mode {mode!r}; expected one of "
+                         f"{', '.join(map(repr, COLLISION_MODES))}.{hint}")
+    return mode
+
+
+def _collision_mode(entity):
+    """
+    Returns the collision mode of the entity; anything without one (like a
+    plain rect or a view) collides as a rectangle.
+    """
+    return getattr(entity, '_collision_mode', 'rect')
+
+
+def _circle(box):
+    """
+    Returns the center and radius of the largest circle that fits in the box.
+    """
+    return box._x + box._w / 2, box._y + box._h / 2, min(box._w, box._h) / 2
+
+
+@SmartMemoize
+def _rect_mask(width, height):
+    return pygame.Mask((max(width, 0), max(height, 0)), fill=True)
+
+
+@SmartMemoize
+def _circle_mask(width, height):
+    width, height = max(width, 0), max(height, 0)
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    radius = min(width, height) / 2
+    if radius > 0:
+        pygame.draw.circle(surface, (255, 255, 255), (width / 2, height / 2), radius)
+    return pygame.mask.from_surface(surface)
+
+
+def _shape_mask(entity, mode, box):
+    """
+    Returns a :class:`pygame.Mask` of the entity's solid area, anchored at the
+    top-left corner of its collision box.
+    """
+    if mode == 'mask':
+        return entity._pixel_mask()
+    elif mode == 'circle':
+        return _circle_mask(box._w, box._h)
+    return _rect_mask(box._w, box._h)
+
+
+def _circle_hits_rect(circle, box):
+    x, y, radius = circle
+    nearest_x = min(max(x, box._x), box._x + box._w)
+    nearest_y = min(max(y, box._y), box._y + box._h)
+    return hypot(x - nearest_x, y - nearest_y) < radius
+
+
+def _refine_collision(first, first_box, second, second_box):
+    """
+    Decides whether two entities whose collision boxes overlap are actually
+    colliding, given their collision modes. Either entity may be ``None``, for
+    a plain rect.
+
+    :returns: A `bool`
+    """
+    first_mode = _collision_mode(first)
+    second_mode = _collision_mode(second)
+    if first_mode == 'rect' and second_mode == 'rect':
+        return True
+    if first_mode != 'mask' and second_mode != 'mask':
+        if first_mode == 'circle' and second_mode == 'circle':
+            first_x, first_y, first_radius = _circle(first_box)
+            second_x, second_y, second_radius = _circle(second_box)
+            return hypot(first_x - second_x, first_y - second_y) < first_radius + second_radius
+        elif first_mode == 'circle':
+            return _circle_hits_rect(_circle(first_box), second_box)
+        return _circle_hits_rect(_circle(second_box), first_box)
+    first_mask = _shape_mask(first, first_mode, first_box)
+    second_mask = _shape_mask(second, second_mode, second_box)
+    offset = (second_box._x - first_box._x, second_box._y - first_box._y)
+    return first_mask.overlap(second_mask, offset) is not None
+
+
+def _refine_point(entity, box, x, y):
+    """
+    Decides whether an entity whose collision box contains the point is
+    actually colliding with it, given its collision mode.
+
+    :returns: A `bool`
+    """
+    mode = _collision_mode(entity)
+    if mode == 'rect':
+        return True
+    elif mode == 'circle':
+        center_x, center_y, radius = _circle(box)
+        return hypot(x - center_x, y - center_y) < radius
+    mask = entity._pixel_mask()
+    mask_x, mask_y = int(x - box._x), int(y - box._y)
+    width, height = mask.get_size()
+    return 0 <= mask_x < width and 0 <= mask_y < height and bool(mask.get_at((mask_x, mask_y)))
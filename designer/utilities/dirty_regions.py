@@ -0,0 +1,78 @@
+"""
+The DirtyRegions class decides what part of the window gets sent to the
+display each frame. Rather than handing SDL every small rect that was touched,
+overlapping and adjacent rects are merged together first. If that still leaves
+too many rects, or most of the window is dirty anyway, a single full-window
+update is cheaper than many tiny ones.
+"""
+import pygame
+
+
+class _DirtyRegions:
+    """
+    Coalesces dirty rects before they are passed to ``pygame.display.update``.
+
+    :param screen_rect: The area of the window; dirty rects are clipped to it.
+    :type screen_rect: :class:`pygame.Rect`
+    :param int max_rects: The most rects to send to the display in one update;
+                          past this, the whole window is updated instead.
+    :param float full_update_fraction: When the merged dirty area covers at
+                                       least this fraction of the window, the
+                                       whole window is updated instead.
+    """
+    #: The default maximum number of rects passed to the display per frame.
+    MAX_RECTS = 48
+    #: The default fraction of the window that triggers a full update.
+    FULL_UPDATE_FRACTION = 0.6
+
+    def __init__(self, screen_rect, max_rects=MAX_RECTS,
+                 full_update_fraction=FULL_UPDATE_FRACTION):
+        self.screen_rect = pygame.Rect(screen_rect)
+        self.max_rects = max_rects
+        self.full_update_fraction = full_update_fraction
+
+    def coalesce(self, rects):
+        """
+        Merges any of the given rects that overlap or touch, after clipping
+        them to the window.
+
+        :param rects: The dirty rects for this frame.
+        :type rects: a list of :class:`pygame.Rect`
+        :returns: A new `list` of :class:`pygame.Rect`, or ``None`` if the
+                  whole window should be updated instead.
+        """
+        screen_rect = self.screen_rect
+        merged = []
+        for rect in rects:
+            rect = screen_rect.clip(rect)
+            if not rect.width or not rect.height:
+                continue
+            # Growing the probe by a pixel on each side also catches rects
+            # that are merely adjacent to this one.
+            touching = rect.inflate(2, 2).collidelistall(merged)
+            while touching:
+                for index in reversed(touching):
+                    rect.union_ip(merged.pop(index))
+                touching = rect.inflate(2, 2).collidelistall(merged)
+            merged.append(rect)
+        if len(merged) > self.max_rects:
+            return None
+        dirty_area = sum(rect.width * rect.height for rect in merged)
+        if dirty_area >= self.full_update_fraction * screen_rect.width * screen_rect.height:
+            return None
+        return merged
+
+    def update_display(self, rects):
+        """
+        Sends the given dirty rects to the display, coalescing them first.
+
+        :param rects: The dirty rects for this frame.
+        :type rects: a list of :class:`pygame.Rect`
+        """
+        if not rects:
+            return
+        merged = self.coalesce(rects)
+        if merged is None:
+            pygame.display.flip()
+        elif merged:
+            pygame.display.update(merged)
@@ -0,0 +1,144 @@
+"""
+The PhaseTimings class keeps a rolling record of how long each phase of the
+game loop took, so that slow frames can be traced back to the part of the
+loop responsible. Only the most recent samples are kept for each phase, and
+the percentiles are only worked out when someone asks for them.
+
+The phases recorded by the director and scene are:
+
+* ``'events'``: pumping the Pygame events, running the
+  ``director.pre_update`` handlers, and then handling the queued input events
+  (which happens at the start of ``director.update``).
+* ``'update'``: running the rest of the ``director.update`` handlers (like
+  ``updating`` handlers and animations) and the ``director.post_update``
+  handlers (like redrawing changed objects and dispatching collisions).
+* ``'render'``: running the ``director.render`` handlers and collecting the
+  blits of every object.
+* ``'draw'``: blitting everything onto the window surface.
+* ``'display'``: sending the dirty parts of the window to the display.
+"""
+from collections import deque
+from time import perf_counter
+
+import pygame
+
+
+class _PhaseTimings:
+    """
+    Rolling histograms of how long each phase of the game loop takes.
+
+    :param int window: How many of the most recent samples to keep for each
+                       phase.
+    """
+    #: The phases of the game loop, in the order they happen.
+    PHASES = ('events', 'update', 'render', 'draw', 'display')
+    #: The default number of samples kept per phase; ten seconds at 30 fps.
+    WINDOW = 300
+    #: The percentiles reported for each phase, besides the maximum.
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, window=WINDOW):
+        self.window = window
+        self.samples = {phase: deque(maxlen=window) for phase in self.PHASES}
+
+    def record(self, phase, seconds):
+        """
+        Adds a new sample for the given phase.
+
+        :param str phase: The name of the phase
+        :param float seconds: How long it took
+        """
+        samples = self.samples.get(phase)
+        if samples is None:
+            samples = self.samples[phase] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def clear(self):
+        """ Forgets every sample recorded so far. """
+        for samples in self.samples.values():
+            samples.clear()
+
+    def percentiles(self, phase):
+        """
+        Summarizes the recent samples for the given phase, in milliseconds.
+
+        :param str phase: The name of the phase
+        :returns: A `dict` with the keys ``'p50'``, ``'p95'``, ``'p99'``,
+                  ``'max'``, and ``'count'``; the timings are ``None`` if there
+                  are no samples yet.
+        """
+        ordered = sorted(self.samples.get(phase, ()))
+        count = len(ordered)
+        summary = {'count': count}
+        for percentile in self.PERCENTILES:
+            # Nearest-rank percentile
+            rank = max(0, -(-percentile * count // 100) - 1)
+            summary['p{}'.format(percentile)] = ordered[rank] * 1000 if ordered else None
+        summary['max'] = ordered[-1] * 1000 if ordered else None
+        return summary
+
+    def summary(self):
+        """
+        Summarizes the recent samples for every phase, in milliseconds.
+
+        :returns: A `dict` mapping each phase name to its :meth:`percentiles`.
+        """
+        return {phase: self.percentiles(phase) for phase in self.samples}
+
+
+class _TimingsOverlay:
+    """
+    Draws a small table of the phase timings in the corner of the window.
+    The text is only re-rendered a few times a second, since the numbers
+    would be unreadable if they changed every frame.
+
+    :param timings: The timings to show
+    :type timings: :class:`_PhaseTimings`
+    """
+    #: How many seconds to wait before re-rendering the text.
+    REFRESH = 0.5
+    #: The color of the text, and of the box behind it.
+    COLOR = (255, 255, 255)
+    BACKGROUND = (0, 0, 0, 180)
+
+    def __init__(self, timings):
+        self.timings = timings
+        self.surface = None
+        self.extra = ""
+        self._next_refresh = 0
+        self._font = None
+
+    def _render(self):
+        if self._font is None:
+            pygame.font.init()
+            # Falls back to the default font when there is no monospace one
+            self._font = pygame.font.SysFont('monospace', 13)
+        lines = ["{:<8}{:>7}{:>7}{:>7}{:>7}".format("ms", "p50", "p95", "p99", "max")]
+        for phase, summary in self.timings.summary().items():
+            if summary['count']:
+                lines.append("{:<8}{:>7.1f}{:>7.1f}{:>7.1f}{:>7.1f}".format(
+                    phase, summary['p50'], summary['p95'], summary['p99'], summary['max']))
+        if self.extra:
+            lines.append(self.extra)
+        rendered = [self._font.render(line, True, self.COLOR) for line in lines]
+        width = max(line.get_width() for line in rendered) + 8
+        height = sum(line.get_height() for line in rendered) + 8
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        surface.fill(self.BACKGROUND)
+        y = 4
+        for line in rendered:
+            surface.blit(line, (4, y))
+            y += line.get_height()
+        self.surface = surface
+
+    def draw(self, screen):
+        """
+        Draws the overlay onto the top-left corner of the screen.
+
+        :returns: The :class:`pygame.Rect` that was drawn over.
+        """
+        now = perf_counter()
+        if self.surface is None or now >= self._next_refresh:
+            self._render()
+            self._next_refresh = now + self.REFRESH
+        return screen.blit(self.surface, (0, 0))
@@ -0,0 +1,175 @@
+"""
+A RotationSheet holds an image pre-rotated to a fixed number of evenly spaced
+angles, so that an object which is always turning can switch between them
+instead of rotating its image every time its angle changes. The frames are
+filled in a few at a time, once per update, on the main thread (Pygame
+surfaces are not safe to convert from other threads); until a frame is ready,
+the object is rotated the usual way (to the same angle), so nothing looks
+different while the sheet is being filled in.
+
+Sheets are shared between every object with the same image, flip, size, and
+number of steps. Like the transform cache, the least recently used sheets are
+dropped once the frames of every sheet take up more than a fixed number of
+bytes; a sheet too big for the whole budget stops being filled in, and its
+remaining angles are rotated the usual way.
+"""
+import os
+from collections import OrderedDict, deque
+
+import pygame
+
+from designer.utilities.vector import Vec2D
+
+#: The default number of megabytes that the sheets may take up in total.
+DEFAULT_BUDGET = float(os.environ.get('DESIGNER_ROTATION_SHEETS_MB', 32))
+#: How many frames are rendered (across every sheet) after each update.
+FRAMES_PER_UPDATE = 8
+
+
+def _surface_bytes(surface):
+    return surface.get_pitch() * surface.get_height()
+
+
+class _RotationSheet:
+    """
+    Rotated copies of a surface at ``steps`` evenly spaced angles. Each of
+    the `frames` is a `tuple` of the rotated surface and the offset its
+    center moved by, or ``None`` until it has been rendered.
+
+    :param surface: The unrotated surface; a copy of it is rotated, in case
+                    it is drawn on while the frames are being rendered.
+    :type surface: :class:`pygame.Surface`
+    :param int steps: How many angles to render, starting at 0 degrees.
+    """
+
+    def __init__(self, surface, steps):
+        self.surface = surface.copy()
+        self.steps = steps
+        self.frames = [None] * steps
+        #: How many bytes the copy and the rendered frames take up
+        self.size = _surface_bytes(self.surface)
+        # The unrotated frame is never needed, since the image itself is used
+        self._next_step = 1
+
+    @property
+    def finished(self):
+        return self._next_step >= self.steps
+
+    def render_next(self):
+        """
+        Renders the next missing frame.
+
+        :returns: How many bytes the new frame takes up.
+        """
+        index = self._next_step
+        rotated = pygame.transform.rotate(self.surface, index * 360 / self.steps).convert_alpha()
+        center = Vec2D(self.surface.get_rect().center)
+        self.frames[index] = (rotated, center - rotated.get_rect().center)
+        self._next_step += 1
+        cost = _surface_bytes(rotated)
+        self.size += cost
+        return cost
+
+
+class _SheetCache:
+    """
+    A least-recently-used cache of rotation sheets, limited by the total
+    number of bytes their frames take up. The frames still missing from the
+    sheets are rendered by :meth:`render_frames`, oldest sheet first.
+
+    :param int budget: The most bytes the sheets may use.
+    """
+
+    def __init__(self, budget=int(DEFAULT_BUDGET * 1024 * 1024)):
+        self.budget = budget
+        self.size = 0
+        self.evictions = 0
+        self._sheets = OrderedDict()
+        # The sheets that still have frames left to render, oldest first
+        self._unfinished = deque()
+
+    def __len__(self):
+        return len(self._sheets)
+
+    def clear(self):
+        """ Drops every sheet, leaving the counters alone. """
+        self._sheets.clear()
+        self._unfinished.clear()
+        self.size = 0
+
+    def get(self, key, make_surface, steps):
+        """
+        Returns the sheet for the given key, starting a new one if there isn't
+        one yet, and marks it as the most recently used. The unrotated surface
+        is only made (by calling `make_surface`) when a new sheet is needed.
+        """
+        sheet = self._sheets.get(key)
+        if sheet is not None:
+            self._sheets.move_to_end(key)
+            return sheet
+        sheet = self._sheets[key] = _RotationSheet(make_surface(), steps)
+        if not sheet.finished:
+            self._unfinished.append(sheet)
+        self._charge(sheet, sheet.size)
+        return sheet
+
+    def render_frames(self, budget):
+        """ Renders up to `budget` of the frames still missing from the sheets. """
+        while budget > 0 and self._unfinished:
+            sheet = self._unfinished[0]
+            self._charge(sheet, sheet.render_next())
+            if sheet.finished and self._unfinished and self._unfinished[0] is sheet:
+                self._unfinished.popleft()
+            budget -= 1
+
+    def _charge(self, sheet, cost):
+        """
+        Adds `cost` bytes for the given sheet, dropping the least recently
+        used other sheets until everything fits in the budget again. If the
+        sheet is too big to fit on its own, it is not filled in any further.
+        """
+        self.size += cost
+        for key in list(self._sheets):
+            if self.size <= self.budget:
+                return
+            if self._sheets[key] is not sheet:
+                self._drop(key)
+        if self.size > self.budget and sheet in self._unfinished:
+            self._unfinished.remove(sheet)
+
+    def _drop(self, key):
+        dropped = self._sheets.pop(key)
+        self.size -= dropped.size
+        self.evictions += 1
+        if dropped in self._unfinished:
+            self._unfinished.remove(dropped)
+
+    def stats(self):
+        """
+        :returns: A `dict` of the number of ``evictions`` so far, plus the
+                  current number of ``sheets``, how many are ``unfinished``,
+                  and the ``bytes`` they use.
+        """
+        return {'evictions': self.evictions, 'sheets': len(self._sheets),
+                'unfinished': len(self._unfinished), 'bytes': self.size}
+
+
+#: The sheets shared by every object.
+ROTATION_SHEETS = _SheetCache()
+
+
+def _rotation_sheet(key, make_surface, steps):
+    """
+    Returns the sheet for the given key from the shared cache, starting a new
+    one if there isn't one yet.
+    """
+    return ROTATION_SHEETS.get(key, make_surface, steps)
+
+
+def _render_sheet_frames(budget=FRAMES_PER_UPDATE):
+    """
+    Renders up to `budget` of the frames still missing from the shared
+    sheets, finishing the oldest sheet first. The scene calls this after every
+    update, so that filling in a sheet is spread out over many updates.
+    """
+    ROTATION_SHEETS.render_frames(budget)
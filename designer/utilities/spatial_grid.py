@@ -0,0 +1,119 @@
+"""
+The SpatialGrid class is a uniform-grid spatial index: rectangles are filed
+into every fixed-size cell that they touch, so that finding everything near a
+region only needs to look at the handful of cells that region covers instead
+of every rectangle in the scene.
+
+The grid is deliberately coarse: a query returns every key that *might*
+overlap the given region, and the caller is expected to do the precise test
+(e.g., ``colliderect``) on that much smaller candidate set.
+"""
+from collections import defaultdict
+
+
+class _SpatialGrid:
+    """
+    A uniform grid over arbitrary hashable keys, each associated with one
+    rectangle. Any rect-like object with ``x``, ``y``, ``w``, and ``h``
+    attributes can be used (both Pygame and Designer rects work).
+
+    :param int cell_size: The width and height of each grid cell in pixels.
+    """
+    #: The default width and height of a cell. Roughly the size of a typical
+    #: sprite, so most objects only land in one to four cells.
+    CELL_SIZE = 64
+
+    def __init__(self, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = defaultdict(set)
+        self.rects = {}
+        self.key_cells = {}
+
+    def __len__(self):
+        return len(self.rects)
+
+    def __contains__(self, key):
+        return key in self.rects
+
+    def _cells_for(self, rect):
+        """
+        Computes the grid cells covered by the given rect. The right and bottom
+        edges are treated inclusively so that touching rects share a cell.
+
+        :param rect: The region to convert to cells.
+        :returns: A `list` of (column, row) tuples.
+        """
+        size = self.cell_size
+        left, right = sorted((rect.x, rect.x + rect.w))
+        top, bottom = sorted((rect.y, rect.y + rect.h))
+        columns = range(int(left // size), int(right // size) + 1)
+        rows = range(int(top // size), int(bottom // size) + 1)
+        return [(column, row) for column in columns for row in rows]
+
+    def insert(self, key, rect):
+        """
+        Adds the key to the grid at the given rect, replacing its previous
+        location if it was already present.
+
+        :param key: Any hashable object.
+        :param rect: The area covered by the key.
+        """
+        if key in self.rects:
+            self.remove(key)
+        key_cells = self._cells_for(rect)
+        cells = self.cells
+        for cell in key_cells:
+            cells[cell].add(key)
+        self.rects[key] = rect
+        self.key_cells[key] = key_cells
+
+    def remove(self, key):
+        """
+        Removes the key from the grid, if it is present.
+
+        :param key: A key previously added with :meth:`insert`.
+        """
+        if key not in self.rects:
+            return
+        del self.rects[key]
+        cells = self.cells
+        for cell in self.key_cells.pop(key):
+            bucket = cells[cell]
+            bucket.discard(key)
+            if not bucket:
+                del cells[cell]
+
+    def query(self, rect):
+        """
+        Finds every key that shares a grid cell with the given rect. This is a
+        superset of the keys actually overlapping the rect.
+
+        :param rect: The region to search.
+        :returns: A `set` of keys.
+        """
+        cells = self.cells
+        result = set()
+        for cell in self._cells_for(rect):
+            if cell in cells:
+                result.update(cells[cell])
+        return result
+
+    def query_point(self, x, y):
+        """
+        Finds every key that shares a grid cell with the given point. This is a
+        superset of the keys actually containing the point.
+
+        :param float x: The horizontal position of the point.
+        :param float y: The vertical position of the point.
+        :returns: A `set` of keys.
+        """
+        size = self.cell_size
+        return set(self.cells.get((int(x // size), int(y // size)), ()))
+
+    def clear(self):
+        """
+        Removes every key from the grid.
+        """
+        self.cells.clear()
+        self.rects.clear()
+        self.key_cells.clear()
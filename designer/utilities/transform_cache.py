@@ -0,0 +1,184 @@
+"""
+The TransformCache shares flipped, scaled, and rotated versions of images
+between every object that needs them. Two coins spinning in step, or one coin
+returning to an angle it has been at before, only pay for the rotation once.
+
+Entries are keyed by the source image's content and the exact transform, and
+the least recently used ones are dropped once the cached surfaces take up
+more than a fixed number of bytes. Angles are rounded to the nearest
+:data:`ANGLE_STEP` degrees, so that slightly different angles share an entry.
+
+The same cache also holds the images of primitive shapes (circles, rectangles,
+and so on), keyed by everything that affects how they look, so that a
+thousand identical dots are drawn once and share a single surface.
+
+Surfaces handed out by the cache are shared, and must never be drawn on or
+otherwise changed; make a copy first.
+"""
+import os
+from collections import OrderedDict
+
+import pygame
+
+from designer.core.internal_image import DesignerSurface
+from designer.utilities.vector import Vec2D
+from designer.utilities.rotation_sheets import _rotation_sheet
+
+#: Angles are rounded to a multiple of this many degrees before rotating.
+ANGLE_STEP = 0.5
+#: The default number of megabytes that cached surfaces may take up in total.
+DEFAULT_BUDGET = float(os.environ.get('DESIGNER_TRANSFORM_CACHE_MB', 64))
+
+
+class _TransformCache:
+    """
+    A least-recently-used cache of transformed surfaces, limited by the total
+    number of bytes the surfaces take up.
+
+    :param int budget: The most bytes the cached surfaces may use.
+    """
+
+    def __init__(self, budget=int(DEFAULT_BUDGET * 1024 * 1024)):
+        self.budget = budget
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """ Drops every cached surface, leaving the counters alone. """
+        self._entries.clear()
+        self.size = 0
+
+    def get(self, key):
+        """
+        Returns the value cached under the key, or ``None`` if there isn't one,
+        and marks it as the most recently used.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, value, surface):
+        """
+        Caches the value under the key, charging the size of the surface
+        against the budget. Values too large for the whole budget are not
+        cached at all.
+        """
+        cost = surface.get_pitch() * surface.get_height()
+        if cost > self.budget:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.size -= old[1]
+        self._entries[key] = (value, cost)
+        self.size += cost
+        while self.size > self.budget:
+            _, (_, freed) = self._entries.popitem(last=False)
+            self.size -= freed
+            self.evictions += 1
+
+    def stats(self):
+        """
+        :returns: A `dict` of the number of ``hits``, ``misses``, and
+                  ``evictions`` so far, plus the current number of
+                  ``entries`` and the ``bytes`` they use.
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'entries': len(self._entries), 'bytes': self.size}
+
+
+#: The cache shared by every object.
+TRANSFORM_CACHE = _TransformCache()
+
+
+def _quantize_angle(angle):
+    return round((angle % 360) / ANGLE_STEP) * ANGLE_STEP % 360
+
+
+def _transform_image(image, flip_x, flip_y, scale, angle, rotation_steps=0):
+    """
+    Flips, scales, and then rotates the internal image, reusing an earlier
+    result for the same image and transform when there is one. Rotating keeps
+    the center of the scaled image aligned with the center of the result.
+
+    :param image: The source image; it is not changed.
+    :type image: :class:`InternalImage <designer.core.internal_image.InternalImage>`
+    :param scale: The horizontal and vertical scaling factors.
+    :type scale: :class:`Vec2D <designer.utilities.vector.Vec2D>`
+    :param int rotation_steps: If given, the angle snaps to the nearest of
+                               this many evenly spaced angles, which are
+                               taken from a pre-rotated sheet once it is
+                               ready.
+    :returns: ``None`` if the image is scaled down to nothing; otherwise, a
+              `tuple` of the shared surface and the offset the rotation moved
+              the center by. When there is nothing to do, the surface is the
+              image's own.
+    """
+    source = image._surf
+    width, height = source.get_size()
+    size = scale * (width, height)
+    size = (int(size[0]), int(size[1]))
+    if 0 in size:
+        return None
+    if rotation_steps:
+        step = round((angle % 360) * rotation_steps / 360) % rotation_steps
+        if step:
+            sheet = _rotation_sheet((image._key, image._version, flip_x, flip_y, size, rotation_steps),
+                                    lambda: _transform_image(image, flip_x, flip_y, scale, 0)[0],
+                                    rotation_steps)
+            frame = sheet.frames[step]
+            if frame is not None:
+                return frame
+        angle = step * 360 / rotation_steps
+    else:
+        angle = _quantize_angle(angle)
+    if not flip_x and not flip_y and size == (width, height) and not angle:
+        return source, Vec2D(0, 0)
+    key = (image._key, image._version, flip_x, flip_y, size, angle)
+    cached = TRANSFORM_CACHE.get(key)
+    if cached is not None:
+        return cached
+    # Flip
+    if flip_x or flip_y:
+        source = pygame.transform.flip(source, flip_x, flip_y)
+    # Scale
+    if size != (width, height):
+        source = pygame.transform.smoothscale(source, size, DesignerSurface(size))
+    # Rotate
+    offset = Vec2D(0, 0)
+    if angle:
+        old = Vec2D(source.get_rect().center)
+        source = pygame.transform.rotate(source, angle).convert_alpha()
+        offset = old - source.get_rect().center
+    TRANSFORM_CACHE.put(key, (source, offset), source)
+    return source, offset
+
+
+def _shape_surface(key, draw):
+    """
+    Returns the shared image of a primitive shape, drawing it only if no
+    other shape with the same appearance has been drawn recently.
+
+    :param tuple key: Everything that affects how the shape looks, starting
+                      with the kind of shape (e.g., ``'circle'``).
+    :param draw: A function that draws the shape, returning a `tuple` of the
+                 surface and the offset its center moved by when it was
+                 rotated (or ``None``, if it was not rotated).
+    :returns: The `tuple` returned by `draw`, or by an earlier call with the
+              same key. The surface is shared, and must not be changed.
+    """
+    cached = TRANSFORM_CACHE.get(key)
+    if cached is not None:
+        return cached
+    drawn = draw()
+    TRANSFORM_CACHE.put(key, drawn, drawn[0])
+    return drawn
@@ -0,0 +1,39 @@
+import os
+
+# Run every game without a window, as fast as it will go
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+os.environ['DESIGNER_HEADLESS'] = '1'
+
+import pytest
+
+import designer
+
+
+@pytest.fixture(autouse=True)
+def director():
+    """ Gives each test a brand new director, and so a brand new scene. """
+    designer.GLOBAL_DIRECTOR = None
+    designer.check_initialized()
+    yield designer.GLOBAL_DIRECTOR
+    designer.GLOBAL_DIRECTOR = None
+
+
+def run_updates(count, setup=None):
+    """
+    Starts the game, stopping it again once `count` whole updates (including
+    everything done after each one, like collision events) have run. The
+    world is whatever `setup` returns, and is returned once the game stops.
+    """
+    state = {'updates': 0}
+
+    def count_updates():
+        if state['updates'] == count:
+            designer.stop()
+        state['updates'] += 1
+
+    if setup is not None:
+        designer.when('starting', setup)
+    designer.GLOBAL_DIRECTOR.current_scene.register('director.pre_update', count_updates)
+    designer.start()
+    return designer.GLOBAL_DIRECTOR.game_state
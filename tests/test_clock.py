@@ -0,0 +1,83 @@
+from designer.core.clock import GameClock, VirtualTime
+
+
+def make_clock():
+    return GameClock(max_ups=10, time_source=VirtualTime())
+
+
+def run_ticks(clock, count):
+    for _ in range(count):
+        clock.tick()
+
+
+def heap_cancellations(clock):
+    return sum(item.cancelled for _, _, item in clock._schedules)
+
+
+def test_items_run_every_interval():
+    clock = make_clock()
+    calls = []
+    clock.schedule(lambda: calls.append(clock.get_ticks()), 0.2)
+    # Two seconds of updates
+    run_ticks(clock, 20)
+    assert len(calls) == 10
+
+
+def test_cancelling_a_queued_item_is_counted():
+    clock = make_clock()
+    items = [clock.schedule(lambda: None, 1) for _ in range(5)]
+    items[0].cancel()
+    items[0].cancel()
+    items[1].cancel()
+    assert clock._cancelled_count == heap_cancellations(clock) == 2
+    run_ticks(clock, 20)
+    assert clock._cancelled_count == heap_cancellations(clock) == 0
+
+
+def test_callback_cancelling_its_own_item_is_not_counted():
+    clock = make_clock()
+    calls = []
+
+    def once():
+        calls.append(None)
+        item.cancel()
+
+    item = clock.schedule(once, 0.1)
+    run_ticks(clock, 10)
+    assert len(calls) == 1
+    assert clock._cancelled_count == 0
+    assert not clock._schedules
+
+
+def test_rescheduling_from_the_callback_is_not_counted():
+    clock = make_clock()
+    calls = []
+
+    def again(interval):
+        calls.append(interval)
+        clock.schedule_interval(again, 0.1)
+
+    clock.schedule_interval(again, 0.1)
+    run_ticks(clock, 20)
+    assert len(calls) > 10
+    assert clock._cancelled_count == heap_cancellations(clock) == 0
+    assert len(clock._schedules) == 1
+
+
+def test_finished_items_are_not_counted_when_cancelled():
+    clock = make_clock()
+    item = clock.schedule(lambda: None, 0.1, life=1)
+    run_ticks(clock, 5)
+    item.cancel()
+    assert clock._cancelled_count == 0
+
+
+def test_compaction_keeps_the_count_in_step():
+    clock = make_clock()
+    items = [clock.schedule(lambda: None, 1) for _ in range(100)]
+    for item in items[:80]:
+        item.cancel()
+    assert clock._cancelled_count == heap_cancellations(clock)
+    assert len(clock._schedules) < 100
+    run_ticks(clock, 15)
+    assert clock._cancelled_count == heap_cancellations(clock) == 0
@@ -0,0 +1,99 @@
+from designer import *
+
+from conftest import run_updates
+
+
+class Bullet(Rectangle):
+    pass
+
+
+def test_fires_once_per_overlapping_pair():
+    hits = []
+
+    def setup():
+        return {'bullets': [Bullet('red', 10, 10, 100, 100), Bullet('red', 10, 10, 400, 100)],
+                'enemies': [circle('blue', 10, 105, 100), circle('blue', 10, 700, 500)]}
+
+    def hit(world, bullet, enemy):
+        hits.append((bullet, enemy))
+
+    when('colliding', Bullet, Circle, hit)
+    world = run_updates(1, setup)
+    assert hits == [(world['bullets'][0], world['enemies'][0])]
+
+
+def test_passes_world_first_and_second():
+    received = []
+
+    def setup():
+        return {'bullet': Bullet('red', 10, 10, 100, 100), 'enemy': circle('blue', 10, 100, 100)}
+
+    def hit(world, first, second):
+        received.append((world, first, second))
+
+    when('colliding', Bullet, Circle, hit)
+    world = run_updates(1, setup)
+    assert len(received) == 1
+    assert received[0][0] is world
+    assert received[0][1] is world['bullet']
+    assert received[0][2] is world['enemy']
+
+
+def test_same_kind_pairs_are_only_sent_once():
+    hits = []
+
+    def setup():
+        return [circle('blue', 10, 100, 100), circle('blue', 10, 105, 100), circle('blue', 10, 500, 100)]
+
+    def hit(world, first, second):
+        hits.append((first, second))
+
+    when('colliding', Circle, Circle, hit)
+    world = run_updates(1, setup)
+    assert hits == [(world[0], world[1])]
+
+
+def test_layer_names_can_be_kinds():
+    hits = []
+
+    def setup():
+        return {'wall': rectangle('green', 20, 20, 100, 100, layer='walls'),
+                'ball': circle('blue', 10, 100, 100)}
+
+    def hit(world, wall, ball):
+        hits.append((wall, ball))
+
+    when('colliding', 'walls', Circle, hit)
+    world = run_updates(1, setup)
+    assert hits == [(world['wall'], world['ball'])]
+
+
+def test_stops_firing_after_destroy():
+    hits = []
+
+    def setup():
+        return {'bullet': Bullet('red', 10, 10, 100, 100), 'enemy': circle('blue', 10, 100, 100)}
+
+    def hit(world, bullet, enemy):
+        hits.append(enemy)
+        destroy(enemy)
+
+    when('colliding', Bullet, Circle, hit)
+    run_updates(5, setup)
+    assert len(hits) == 1
+
+
+def test_destroyed_object_is_skipped_by_later_pairs():
+    hits = []
+
+    def setup():
+        return {'bullets': [Bullet('red', 10, 10, 100, 100), Bullet('red', 10, 10, 102, 100)],
+                'enemy': circle('blue', 10, 100, 100)}
+
+    def hit(world, bullet, enemy):
+        hits.append(bullet)
+        destroy(enemy)
+
+    when('colliding', Bullet, Circle, hit)
+    world = run_updates(3, setup)
+    assert hits == [world['bullets'][0]]
@@ -0,0 +1,140 @@
+import random
+
+import pytest
+
+import designer
+from designer import *
+from designer.utilities import batch_collision
+from designer.utilities.batch_collision import _colliding_candidates, _boxes_collide
+from designer.utilities.rect import Rect
+from designer.utilities.spatial_grid import _SpatialGrid
+
+from conftest import run_updates
+
+
+@pytest.fixture(params=['python', 'numpy'])
+def backend(request, monkeypatch):
+    """ Runs the test both with and without the vectorized NumPy checks. """
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+        monkeypatch.setattr(batch_collision, 'HAS_NUMPY', True)
+    else:
+        monkeypatch.setattr(batch_collision, 'HAS_NUMPY', False)
+    return request.param
+
+
+def play(check, setup):
+    """ Calls `check` with the world during the first update of the game. """
+    results = []
+    when('updating', lambda world: results.append(check(world)) if not results else None)
+    run_updates(1, setup)
+    return results[0]
+
+
+def scattered_boxes():
+    random.seed(7)
+    boxes = [rectangle('red', random.randint(1, 90), random.randint(1, 90),
+                       random.randint(0, 800), random.randint(0, 600)) for _ in range(150)]
+    # Zero sized boxes do not follow the usual overlap rule
+    boxes.append(rectangle('red', 0, 10, 100, 100))
+    boxes.append(rectangle('red', 10, 0, 300, 300))
+    return boxes
+
+
+def test_colliding_pairs_match_checking_every_pair(backend):
+    def check(boxes):
+        firsts, seconds = boxes[:60], boxes[40:]
+        expected = [(first, second) for first in firsts for second in seconds
+                    if first is not second and colliding(first, second)]
+        assert colliding_pairs(firsts, seconds) == expected
+        assert expected
+
+    play(check, scattered_boxes)
+
+
+def test_colliding_any_matches_checking_every_object(backend):
+    def check(boxes):
+        for box in boxes[:30] + boxes[-2:]:
+            assert colliding_any(box, boxes) == any(colliding(box, other) for other in boxes if other is not box)
+
+    play(check, scattered_boxes)
+
+
+# Objects are placed by their centers, so a 40 by 40 rectangle at (100, 100)
+# covers 80 to 120 on each side
+def test_get_colliding_objects(backend):
+    def check(world):
+        assert get_colliding_objects(world['player']) == [world['near'], world['overlapping']]
+
+    play(check, lambda: {'player': rectangle('red', 40, 40, 100, 100),
+                         'near': circle('blue', 10, 110, 110),
+                         'overlapping': rectangle('green', 10, 10, 122, 100),
+                         'touching': rectangle('green', 10, 10, 125, 60),
+                         'far': circle('blue', 10, 500, 500)})
+
+
+def test_get_objects_in_area_and_at(backend):
+    def check(world):
+        assert get_objects_in_area(0, 0, 200, 200) == [world['a'], world['b']]
+        assert get_objects_in_area(300, 300, 400, 300) == [world['c']]
+        assert get_objects_at(100, 100) == [world['a']]
+        assert get_objects_at(145, 145) == [world['a'], world['b']]
+        assert get_objects_at(10, 590) == []
+
+    play(check, lambda: {'a': rectangle('red', 100, 100, 100, 100),
+                         'b': circle('blue', 20, 160, 160),
+                         'c': rectangle('green', 30, 30, 500, 500)})
+
+
+def test_queries_follow_objects_across_cells(backend):
+    def check(world):
+        mover, target = world['mover'], world['target']
+        assert get_colliding_objects(mover) == []
+        # Well past the grid's cell size, so the mover lands in new cells
+        mover.x += 6 * _SpatialGrid.CELL_SIZE
+        assert get_colliding_objects(mover) == [target]
+        assert get_objects_at(mover.x, mover.y) == [mover, target]
+        assert get_objects_at(50, 300) == []
+        assert colliding_pairs([mover], [target]) == [(mover, target)]
+        mover.y += 3 * _SpatialGrid.CELL_SIZE
+        assert get_colliding_objects(mover) == []
+        assert get_objects_in_area(mover.x - 5, mover.y - 5, 10, 10) == [mover]
+        assert colliding_pairs([mover], [target]) == []
+
+    play(check, lambda: {'mover': rectangle('red', 20, 20, 50, 300),
+                         'target': rectangle('blue', 40, 40, 50 + 6 * _SpatialGrid.CELL_SIZE, 300)})
+
+
+def test_destroyed_objects_are_not_found(backend):
+    def check(world):
+        destroy(world['b'])
+        assert get_colliding_objects(world['a']) == []
+        assert get_objects_at(100, 100) == [world['a']]
+        assert colliding_pairs([world['a']], [world['b']]) == []
+
+    play(check, lambda: {'a': rectangle('red', 40, 40, 100, 100), 'b': rectangle('blue', 40, 40, 100, 100)})
+
+
+def test_colliding_candidates_match_boxes_collide(backend):
+    random.seed(3)
+    boxes = [Rect(random.randint(0, 200), random.randint(0, 200), random.randint(0, 40), random.randint(0, 40))
+             for _ in range(80)]
+    candidates = [(first, second) for first in range(len(boxes)) for second in range(len(boxes))]
+    expected = [(first, second) for first, second in candidates if _boxes_collide(boxes[first], boxes[second])]
+    random.shuffle(candidates)
+    assert _colliding_candidates(boxes, boxes, candidates) == expected
+
+
+def test_spatial_grid_moves_and_removes():
+    grid = _SpatialGrid(cell_size=10)
+    grid.insert('a', Rect(0, 0, 5, 5))
+    grid.insert('b', Rect(25, 25, 5, 5))
+    assert grid.query(Rect(1, 1, 2, 2)) == {'a'}
+    assert grid.query_point(27, 27) == {'b'}
+    grid.insert('a', Rect(21, 21, 5, 5))
+    assert grid.query(Rect(1, 1, 2, 2)) == set()
+    assert grid.query(Rect(22, 22, 1, 1)) == {'a', 'b'}
+    grid.remove('b')
+    assert 'b' not in grid
+    assert grid.query_point(27, 27) == {'a'}
+    assert len(grid) == 1
@@ -0,0 +1,55 @@
+import gc
+from dataclasses import dataclass
+
+import designer
+from designer import *
+
+from conftest import run_updates
+
+
+@dataclass
+class World:
+    ticks: int = 0
+
+    def tick(self):
+        self.ticks += 1
+
+
+def test_dataclass_bound_handler():
+    # Dataclasses are not hashable, but their methods can still be handlers
+    world = World()
+    when('updating', world.tick)
+    run_updates(5)
+    assert world.ticks == 5
+
+
+def test_register_and_unregister_dataclass_bound_handler():
+    world = World()
+    scene = designer.GLOBAL_DIRECTOR.current_scene
+    scene.register('director.update', world.tick)
+    scene._handle_event('director.update')
+    scene._unregister('director.update', world.tick)
+    scene._handle_event('director.update')
+    assert world.ticks == 1
+
+
+def test_unregister_object_events_for_dataclass():
+    world = World()
+    scene = designer.GLOBAL_DIRECTOR.current_scene
+    scene.register('director.update', world.tick)
+    scene.register('director.post_update', world.tick)
+    scene._unregister_object_events(world)
+    scene._handle_event('director.update')
+    scene._handle_event('director.post_update')
+    assert world.ticks == 0
+
+
+def test_handler_index_forgets_collected_objects():
+    scene = designer.GLOBAL_DIRECTOR.current_scene
+    world = World()
+    scene.register('director.update', world.tick)
+    key = id(world)
+    assert key in scene._object_handlers
+    del world
+    gc.collect()
+    assert key not in scene._object_handlers
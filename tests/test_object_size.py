@@ -0,0 +1,50 @@
+import pygame
+
+from designer import *
+
+from conftest import run_updates
+
+
+def play(check, setup):
+    """ Calls `check` with the world during the first update of the game. """
+    results = []
+    when('updating', lambda world: results.append(check(world)) if not results else None)
+    run_updates(1, setup)
+    return results[0]
+
+
+def test_text_size_is_current_right_after_a_change():
+    def check(label):
+        short_width = label.width
+        label.text = 'A much longer piece of text'
+        assert label.width > short_width
+        assert label.size[0] == label.width
+        assert label.rect.width == label.width
+
+    play(check, lambda: text('black', 'Hi', 20, 100, 100))
+
+
+def test_setting_height_keeps_the_current_width():
+    def check(box):
+        box.width = 50
+        box.height = 20
+        assert (box.width, box.height) == (50, 20)
+        box.height = 30
+        box.width = 70
+        assert (box.width, box.height) == (70, 30)
+
+    play(check, lambda: rectangle('red', 10, 10, 100, 100))
+
+
+def test_image_size_is_current_right_after_scaling(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    path = 'square.png'
+    pygame.image.save(pygame.Surface((20, 10)), path)
+
+    def check(picture):
+        picture.scale = 2
+        assert picture.size == (40, 20)
+        picture.scale = 3
+        assert (picture.width, picture.height) == (60, 30)
+
+    play(check, lambda: image(path, 100, 100))
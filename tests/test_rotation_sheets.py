@@ -0,0 +1,47 @@
+import pygame
+
+from designer.utilities.rotation_sheets import _SheetCache, _surface_bytes
+
+
+def square(size):
+    return lambda: pygame.Surface((size, size), pygame.SRCALPHA)
+
+
+def test_sheets_fill_in_a_few_frames_at_a_time():
+    sheets = _SheetCache()
+    sheet = sheets.get('a', square(10), 8)
+    sheets.render_frames(3)
+    assert sum(frame is not None for frame in sheet.frames) == 3
+    sheets.render_frames(100)
+    assert sheet.finished
+    assert sheet.frames[0] is None
+    assert all(frame is not None for frame in sheet.frames[1:])
+    assert sheets.stats()['unfinished'] == 0
+
+
+def test_byte_budget_drops_least_recently_used_sheets():
+    # Each 10 by 10 frame takes up at least 400 bytes
+    sheets = _SheetCache(budget=8000)
+    first = sheets.get('a', square(10), 4)
+    sheets.get('b', square(10), 4)
+    sheets.render_frames(100)
+    assert sheets.size == first.size + sheets.get('b', None, 4).size
+    assert sheets.get('a', None, 4) is first
+    for name in 'cdefgh':
+        sheets.get(name, square(10), 4)
+        sheets.render_frames(100)
+        assert sheets.size <= sheets.budget
+    assert sheets.stats()['evictions'] > 0
+    assert len(sheets) < 8
+
+
+def test_sheet_too_big_for_the_budget_stops_filling_in():
+    sheets = _SheetCache(budget=2000)
+    sheet = sheets.get('a', square(10), 64)
+    sheets.render_frames(100)
+    assert not sheet.finished
+    # Only the frame that went over the budget is kept beyond it
+    last_frame = sheet.frames[sheet._next_step - 1][0]
+    assert sheets.size - _surface_bytes(last_frame) <= sheets.budget
+    assert sheets.stats()['unfinished'] == 0
+    assert sheets.get('a', None, 64) is sheet
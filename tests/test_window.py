@@ -0,0 +1,31 @@
+import pygame
+
+import designer
+from designer import *
+
+from conftest import run_updates
+
+
+def test_no_title_shows_statistics_in_the_caption_only():
+    set_window_title(None)
+    captions = []
+    when('updating', lambda: captions.append(pygame.display.get_caption()[0]))
+    run_updates(3, lambda: circle('red', 10, 100, 100))
+    assert captions[-1].endswith('fps')
+    assert designer.GLOBAL_DIRECTOR.show_timings is False
+    assert designer.GLOBAL_DIRECTOR.current_scene._timings_overlay is None
+
+
+def test_title_is_kept_while_drawing():
+    set_window_title('My Game')
+    captions = []
+    when('updating', lambda: captions.append(pygame.display.get_caption()[0]))
+    run_updates(3, lambda: circle('red', 10, 100, 100))
+    assert captions[1:] == ['My Game', 'My Game']
+    assert designer.GLOBAL_DIRECTOR.show_timings is False
+
+
+def test_timings_overlay_is_opt_in():
+    designer.GLOBAL_DIRECTOR.show_timings = True
+    run_updates(2, lambda: circle('red', 10, 100, 100))
+    assert designer.GLOBAL_DIRECTOR.current_scene._timings_overlay is not None